@@ -1,4 +1,7 @@
+from .complexes import ComplexDecimal
 from .inputting import checked_input, input_menu, input_filename, input_int_range, input_bool, input_decimal, input_int
+from .mapped import MappedColumns
 from .matrix import Matrix, Row, ColumnPicker
-from .slaes import LinearEquationSystem
-from .utils import number_to_decimal, beautify_decimal, NUMBER, NotImplementedField
+from .parallel import ForkedPool
+from .slaes import LinearEquationSystem, SparseLinearEquationSystem
+from .utils import number_to_decimal, beautify_decimal, decimal_pi, decimal_cos, compensated_sum, NUMBER, NotImplementedField
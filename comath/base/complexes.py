@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+from math import cos, sin
+
+from .utils import NUMBER, number_to_decimal, beautify_decimal
+
+
+@dataclass(frozen=True)
+class ComplexDecimal:
+    real: Decimal = Decimal()
+    imag: Decimal = Decimal()
+
+    @classmethod
+    def convert(cls, value: ComplexDecimal | complex | NUMBER) -> ComplexDecimal:
+        if isinstance(value, ComplexDecimal):
+            return value
+        if isinstance(value, complex):
+            return cls(number_to_decimal(value.real), number_to_decimal(value.imag))
+        return cls(number_to_decimal(value))
+
+    @classmethod
+    def from_polar(cls, radius: NUMBER, angle: float) -> ComplexDecimal:
+        radius = number_to_decimal(radius)
+        return cls(radius * Decimal.from_float(cos(angle)), radius * Decimal.from_float(sin(angle)))
+
+    def __add__(self, other: ComplexDecimal | complex | NUMBER) -> ComplexDecimal:
+        other = self.convert(other)
+        return ComplexDecimal(self.real + other.real, self.imag + other.imag)
+
+    def __radd__(self, other: complex | NUMBER) -> ComplexDecimal:
+        return self + other
+
+    def __sub__(self, other: ComplexDecimal | complex | NUMBER) -> ComplexDecimal:
+        other = self.convert(other)
+        return ComplexDecimal(self.real - other.real, self.imag - other.imag)
+
+    def __rsub__(self, other: complex | NUMBER) -> ComplexDecimal:
+        return -self + other
+
+    def __mul__(self, other: ComplexDecimal | complex | NUMBER) -> ComplexDecimal:
+        other = self.convert(other)
+        return ComplexDecimal(self.real * other.real - self.imag * other.imag,
+                              self.real * other.imag + self.imag * other.real)
+
+    def __rmul__(self, other: complex | NUMBER) -> ComplexDecimal:
+        return self * other
+
+    def __truediv__(self, other: ComplexDecimal | complex | NUMBER) -> ComplexDecimal:
+        other = self.convert(other)
+        divider: Decimal = other.real ** 2 + other.imag ** 2
+        if divider == 0:
+            raise ZeroDivisionError()
+        return ComplexDecimal((self.real * other.real + self.imag * other.imag) / divider,
+                              (self.imag * other.real - self.real * other.imag) / divider)
+
+    def __rtruediv__(self, other: complex | NUMBER) -> ComplexDecimal:
+        return self.convert(other) / self
+
+    def __neg__(self) -> ComplexDecimal:
+        return ComplexDecimal(-self.real, -self.imag)
+
+    def __pos__(self) -> ComplexDecimal:
+        return self
+
+    def __abs__(self) -> Decimal:
+        return (self.real ** 2 + self.imag ** 2).sqrt()
+
+    def conjugate(self) -> ComplexDecimal:
+        return ComplexDecimal(self.real, -self.imag)
+
+    def __complex__(self) -> complex:
+        return complex(float(self.real), float(self.imag))
+
+    def __str__(self) -> str:
+        if self.imag == 0:
+            return beautify_decimal(self.real)
+        sign = "-" if self.imag < 0 else "+"
+        return f"{beautify_decimal(self.real)} {sign} {beautify_decimal(abs(self.imag))}i"
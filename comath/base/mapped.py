@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from array import array
+from itertools import islice
+from mmap import mmap, ACCESS_READ
+from typing import Iterable, Iterator
+
+from .utils import NUMBER
+
+
+class MappedColumns:
+    # a binary file of native float64 values, row after row: x₀ y₀ x₁ y₁ ... for two columns
+    def __init__(self, filename: str, columns: int = 2):
+        if columns < 1:
+            raise ValueError("There must be at least one column")
+        self.columns: int = columns
+        self.file = open(filename, "rb")
+        # column views keep the map exported, close() has to release them before the map can be closed
+        self.views: list[memoryview] = []
+        try:
+            self.map: mmap | None = mmap(self.file.fileno(), 0, access=ACCESS_READ)
+            self.values: memoryview = memoryview(self.map).cast("d")
+        except ValueError:  # an empty file can't be mapped
+            self.map = None
+            self.values = memoryview(array("d"))
+        if len(self.values) % columns != 0:
+            self.close()
+            raise ValueError(f"File size doesn't fit {columns} columns of float64 values")
+
+    @staticmethod
+    def write(filename: str, rows: Iterable[Iterable[NUMBER]], buffer_rows: int = 65536):
+        rows = iter(rows)
+        with open(filename, "wb") as f:
+            while len(chunk := list(islice(rows, buffer_rows))) != 0:
+                f.write(array("d", (float(value) for row in chunk for value in row)).tobytes())
+
+    def __len__(self) -> int:
+        return len(self.values) // self.columns
+
+    def __getitem__(self, item: int) -> tuple[float, ...]:
+        if not -len(self) <= item < len(self):
+            raise IndexError()
+        item %= len(self)
+        return tuple(self.values[item * self.columns:(item + 1) * self.columns])
+
+    def __iter__(self) -> Iterator[tuple[float, ...]]:
+        # iterators read the table's own view instead of exporting new ones: once it's closed they raise ValueError
+        return zip(*(islice(self.values, j, None, self.columns) for j in range(self.columns)))
+
+    def column(self, index: int) -> memoryview:
+        # a strided view, nothing is copied; it is released by close()
+        view: memoryview = self.values[index::self.columns]
+        self.views.append(view)
+        return view
+
+    def pairs(self, x_column: int = 0, y_column: int = 1) -> Iterator[tuple[float, float]]:
+        return zip(islice(self.values, x_column, None, self.columns), islice(self.values, y_column, None, self.columns))
+
+    def close(self):
+        for view in self.views:
+            view.release()
+        self.views.clear()
+        self.values.release()
+        if self.map is not None:
+            self.map.close()
+        self.file.close()
+
+    def __enter__(self) -> MappedColumns:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
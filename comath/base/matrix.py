@@ -247,7 +247,21 @@ class Matrix:
         return result
 
     def reverse_matrix(self) -> Matrix:
-        pass
+        if self.size[0] != self.size[1]:
+            raise ValueError()
+
+        n: int = self.size[0]
+        rows: list[Row] = [Row([*row, *(int(i == j) for j in range(n))]) for i, row in enumerate(self)]
+        for k in range(n):
+            p: int = max(range(k, n), key=lambda i: abs(rows[i][k]))
+            if rows[p][k] == 0:
+                raise ValueError("Matrix is degenerate")
+            rows[k], rows[p] = rows[p], rows[k]
+            rows[k] = rows[k] / rows[k][k]
+            for i in range(n):
+                if i != k and rows[i][k] != 0:
+                    rows[i] = rows[i] - rows[k] * rows[i][k]
+        return Matrix([Row(row.data[n:]) for row in rows])
 
     def debug_str(self, separate_lines: bool = True, prefix: bool = True):
         result: str = f"Matrix[{self.size}]: {{" if prefix else "{"
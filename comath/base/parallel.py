@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from decimal import Context, getcontext, setcontext
+from multiprocessing import get_all_start_methods, get_context
+from multiprocessing.pool import Pool
+from typing import Callable, Iterable, Iterator, TypeVar
+
+t = TypeVar("t")
+r = TypeVar("r")
+
+_task: Callable | None = None
+
+
+def _initialize(task: Callable, context: Context) -> None:
+    global _task
+    _task = task
+    setcontext(context)
+
+
+def _run(item):
+    return _task(item)
+
+
+class ForkedPool:
+    # workers are forked, so tasks (lambdas included) are inherited instead of pickled,
+    # only the items and the results have to be picklable
+    def __init__(self, task: Callable[[t], r], processes: int = None, chunk_size: int = 1):
+        self.task: Callable[[t], r] = task
+        self.processes: int | None = processes
+        self.chunk_size: int = chunk_size
+        self.pool: Pool | None = None
+
+    def is_serial(self) -> bool:
+        return self.processes == 1 or "fork" not in get_all_start_methods()
+
+    def __enter__(self) -> ForkedPool:
+        if not self.is_serial():
+            self.pool = get_context("fork").Pool(self.processes, _initialize, (self.task, getcontext().copy()))
+        return self
+
+    def __exit__(self, *_) -> None:
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool = None
+
+    def imap(self, items: Iterable[t]) -> Iterator[r]:
+        if self.pool is None:
+            return map(self.task, items)
+        return self.pool.imap(_run, items, self.chunk_size)
+
+    def map(self, items: Iterable[t]) -> list[r]:
+        return list(self.imap(items))
@@ -152,3 +152,58 @@ class LinearEquationSystem(Matrix):
         B: Row = A.drop_column(-1)
         R: Row = A * solution
         return abs(B - R)
+
+
+class SparseLinearEquationSystem:
+    def __init__(self, rows: list[dict[int, Decimal]], free: Row | list[Decimal]):
+        if len(rows) != len(free):
+            raise ValueError(f"Row count mismatch: {len(rows)} != {len(free)}")
+        self.rows: list[dict[int, Decimal]] = [{j: v for j, v in row.items() if v != 0} for row in rows]
+        self.free: list[Decimal] = list(free)
+        self.size: int = len(rows)
+
+    @classmethod
+    def from_matrix(cls, matrix: Matrix, free: Row) -> SparseLinearEquationSystem:
+        return cls([dict(enumerate(row)) for row in matrix], free)
+
+    def to_linear_system(self) -> LinearEquationSystem:
+        return LinearEquationSystem([Row([*(row.get(j, 0) for j in range(self.size)), self.free[i]])
+                                     for i, row in enumerate(self.rows)])
+
+    def solve(self) -> Row:
+        # gaussian elimination over the non-zero entries only, pivoting by the column
+        rows: list[dict[int, Decimal]] = [row.copy() for row in self.rows]
+        free: list[Decimal] = self.free.copy()
+        columns: list[set[int]] = [set() for _ in range(self.size)]
+        for i, row in enumerate(rows):
+            for j in row:
+                columns[j].add(i)
+
+        pivots: list[int] = []
+        for k in range(self.size):
+            if len(columns[k]) == 0:
+                raise ValueError("Matrix is degenerate")
+            p: int = max(columns[k], key=lambda i: abs(rows[i][k]))
+            pivots.append(p)
+            main_row: dict[int, Decimal] = rows[p]
+            for j in main_row:
+                columns[j].discard(p)
+
+            for i in columns[k].copy():
+                coefficient: Decimal = rows[i][k] / main_row[k]
+                for j, value in main_row.items():
+                    result: Decimal = rows[i].get(j, Decimal()) - coefficient * value
+                    if j == k or result == 0:
+                        rows[i].pop(j, None)
+                        columns[j].discard(i)
+                    else:
+                        rows[i][j] = result
+                        columns[j].add(i)
+                free[i] -= coefficient * free[p]
+
+        result: list[Decimal] = [Decimal()] * self.size
+        for k in reversed(range(self.size)):
+            p: int = pivots[k]
+            known: Decimal = sum((value * result[j] for j, value in rows[p].items() if j != k), Decimal())
+            result[k] = (free[p] - known) / rows[p][k]
+        return Row(result)
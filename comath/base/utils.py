@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from decimal import Decimal, DecimalException, getcontext
-from typing import TypeAlias
+from decimal import Decimal, DecimalException, getcontext, localcontext
+from typing import Iterable, TypeAlias
 
 NUMBER: TypeAlias = int | float | str | Decimal
 getcontext().prec = 42
@@ -33,6 +33,58 @@ def beautify_decimal(value: Decimal, quantize: bool = True) -> str:
     return value.to_eng_string()
 
 
+def compensated_sum(values: Iterable[Decimal]) -> Decimal:
+    # Neumaier's summation: the rounding error of every addition is collected separately
+    result: Decimal = Decimal()
+    compensation: Decimal = Decimal()
+    for value in values:
+        total: Decimal = result + value
+        if abs(result) >= abs(value):
+            compensation += (result - total) + value
+        else:
+            compensation += (value - total) + result
+        result = total
+    return result + compensation
+
+
+_pi_cache: dict[int, Decimal] = {}
+
+
+def decimal_pi() -> Decimal:
+    # the series for π from the decimal module documentation, with two guard digits
+    precision: int = getcontext().prec
+    if precision not in _pi_cache:
+        with localcontext() as context:
+            context.prec += 2
+            three = Decimal(3)
+            last, t, s, n, na, d, da = 0, three, three, 1, 0, 0, 24
+            while s != last:
+                last = s
+                n, na = n + na, na + 8
+                d, da = d + da, da + 32
+                t = (t * n) / d
+                s += t
+        _pi_cache[precision] = +s
+    return _pi_cache[precision]
+
+
+def decimal_cos(x: Decimal) -> Decimal:
+    # the Taylor series from the decimal module documentation, after reducing x to [-π, π]
+    with localcontext() as context:
+        context.prec += 2
+        pi: Decimal = decimal_pi()
+        x = x.remainder_near(2 * pi)
+        i, last, s, fact, num, sign = 0, 0, Decimal(1), 1, 1, 1
+        while s != last:
+            last = s
+            i += 2
+            fact *= i * (i - 1)
+            num *= x * x
+            sign *= -1
+            s += num / fact * sign
+    return +s
+
+
 @property
 def NotImplementedField(_):
     raise NotImplementedError()
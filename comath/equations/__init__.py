@@ -1,8 +1,19 @@
+from .batch import BatchSolver
+from .chebyshev import ChebyshevEquation
+from .cubature import CubatureParamSpec, TensorGaussIntegrator, QuasiMonteCarloIntegrator, LowDiscrepancySequence
 from .functions import LinearEquation, SquareEquation, PolynomialEquation, TrigonometricEquation
 from .functions import TrigonometricEquationType, ExponentEquation, LogarithmEquation
 from .integrators import IntegratorParamSpec, Integrator, TrapezoidalIntegrator, SimpsonsIntegrator
 from .integrators import LeftRectangleIntegrator, RightRectangleIntegrator, MiddleRectangleIntegrator
+from .integrators import AdaptiveSimpsonsIntegrator, GaussKronrodIntegrator, RombergIntegrator
+from .integrators import GaussLegendreIntegrator, TanhSinhIntegrator
 from .interfaces import AnyEquation, LambdaEquation, SimpleFunction
+from .polynomials import AberthSolver, PolynomialParamSpec
+from .reports import SolveReport, ProbedEquation
+from .roots import RootIsolator
+from .samples import SampleIntegrator, TrapezoidalSampleIntegrator, SimpsonsSampleIntegrator
 from .solvers import SolveMethod, StraightParamSpec, IterativeParamSpec
-from .solvers import Solver, BisectionSolver, SecantSolver, NewtonSolver, IterationSolver
-from .systems import EquationSystem
+from .solvers import Solver, BisectionSolver, SecantSolver, BrentSolver, NewtonSolver, IterationSolver
+from .solvers import SteffensenSolver
+from .systems import EquationSystem, SystemSolveMethod, VectorEquationSystem
+from .tabulated import TabulatedInterpolation, TabulatedEquation
@@ -0,0 +1,71 @@
+from decimal import Decimal, DecimalException
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+
+from base import ForkedPool
+from .interfaces import AnyEquation
+from .solvers import Solver, ParamSpec, StraightParamSpec, IterativeParamSpec
+
+JOB = AnyEquation | tuple
+
+
+class BatchSolver:
+    def __init__(self, solver: Solver, processes: int = None, chunk_size: int = 1000, warm_start: bool = True):
+        self.solver: Solver = solver
+        self.processes: int | None = processes
+        self.chunk_size: int = chunk_size
+        self.warm_start: bool = warm_start
+
+    def _warm_params(self, params: ParamSpec, root: Decimal, shift: Decimal) -> ParamSpec:
+        if isinstance(params, IterativeParamSpec):
+            return IterativeParamSpec(root)
+        if isinstance(params, StraightParamSpec):
+            # a narrow bracket around the previous root, as wide as the last shift of the root allows
+            a, b = sorted(params.convert())
+            width: Decimal = max(2 * shift, self.solver.precision)
+            return StraightParamSpec(max(a, root - width), min(b, root + width))
+        return params
+
+    def _solve_warm(self, equation: AnyEquation, params: ParamSpec, root: Decimal | None, shift: Decimal) -> Decimal:
+        # the solver checks the narrow bracket itself: when the root has left it, the full one is used
+        if not self.warm_start or root is None:
+            return self.solver.solve(equation, params)
+        warm_params: ParamSpec = self._warm_params(params, root, shift)
+        try:
+            return self.solver.solve(equation, warm_params)
+        except ValueError:
+            if not isinstance(warm_params, StraightParamSpec):
+                raise
+        return self.solver.solve(equation, params)
+
+    def _solve_chunk(self, equations: list[AnyEquation], params: ParamSpec) -> list[Decimal | None]:
+        results: list[Decimal | None] = []
+        root: Decimal | None = None
+        shift: Decimal = Decimal()
+        for equation in equations:
+            try:
+                result: Decimal = self._solve_warm(equation, params, root, shift)
+                if root is not None:
+                    shift = abs(result - root)
+                root = result
+            except (ValueError, ZeroDivisionError, DecimalException):
+                result = root = None
+            results.append(result)
+        return results
+
+    @staticmethod
+    def _chunks(jobs: Iterable[JOB], chunk_size: int) -> Iterator[list[JOB]]:
+        jobs = iter(jobs)
+        while len(chunk := list(islice(jobs, chunk_size))) != 0:
+            yield chunk
+
+    def solve(self, jobs: Iterable[JOB], params: ParamSpec,
+              factory: Callable[..., AnyEquation] = None) -> Iterator[Decimal | None]:
+        # jobs are equations, or argument tuples for the factory (e.g. SquareEquation)
+        def solve_chunk(chunk: list[JOB]) -> list[Decimal | None]:
+            equations = chunk if factory is None else [factory(*job) for job in chunk]
+            return self._solve_chunk(equations, params)
+
+        with ForkedPool(solve_chunk, self.processes) as pool:
+            for results in pool.imap(self._chunks(jobs, self.chunk_size)):
+                yield from results
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+from base import NUMBER, number_to_decimal, decimal_pi, decimal_cos
+from .interfaces import AnyEquation
+
+
+class ChebyshevEquation(AnyEquation):
+    # ∑ cⱼ·Tⱼ(t) on [a, b] with t = (2x - a - b) / (b - a), a cheap stand-in for an expensive equation
+    def __init__(self, coefficients: list[NUMBER], a: NUMBER, b: NUMBER):
+        self.coefficients: list[Decimal] = [number_to_decimal(c) for c in coefficients] or [Decimal()]
+        self.a: Decimal = number_to_decimal(a)
+        self.b: Decimal = number_to_decimal(b)
+        if self.a >= self.b:
+            raise ValueError("Interval must not be empty")
+        self.derivative_series: ChebyshevEquation | None = None
+
+    @staticmethod
+    def _coefficients(values: list[Decimal], cosines: list[Decimal]) -> list[Decimal]:
+        # the discrete cosine transform of the values at the n + 1 extreme points cos(πk / n)
+        n: int = len(values) - 1
+        step: int = len(cosines) // (2 * n)
+        result: list[Decimal] = []
+        for j in range(n + 1):
+            total: Decimal = (values[0] + values[n] * (-1 if j % 2 else 1)) / 2
+            for k in range(1, n):
+                total += values[k] * cosines[j * k * step % len(cosines)]
+            result.append(total * 2 / n)
+        result[0] /= 2
+        result[n] /= 2
+        return result
+
+    @classmethod
+    def fit(cls, equation: AnyEquation, a: NUMBER, b: NUMBER, tolerance: NUMBER = "1E-15",
+            max_degree: int = 4096) -> ChebyshevEquation:
+        # the degree doubles until the tail of the series is negligible, the nested nodes reuse all samples;
+        # the tolerance is relative to the largest coefficient
+        a, b = number_to_decimal(a), number_to_decimal(b)
+        tolerance = number_to_decimal(tolerance)
+        n: int = 16
+        cosines: list[Decimal] = [decimal_cos(decimal_pi() * m / n) for m in range(2 * n)]
+        values: list[Decimal] = [equation.function((a + b) / 2 + (b - a) / 2 * cosines[k]) for k in range(n + 1)]
+        while True:
+            coefficients: list[Decimal] = cls._coefficients(values, cosines)
+            scale: Decimal = max(abs(c) for c in coefficients) or Decimal(1)
+            if max(abs(c) for c in coefficients[-3:]) <= tolerance * scale:
+                break
+            if 2 * n > max_degree:
+                raise ValueError(f"Degree {max_degree} is not enough for the tolerance {tolerance}")
+            n *= 2
+            cosines = [cosines[m // 2] if m % 2 == 0 else decimal_cos(decimal_pi() * m / n) for m in range(2 * n)]
+            new_values: list[Decimal] = [equation.function((a + b) / 2 + (b - a) / 2 * cosines[k])
+                                         for k in range(1, n, 2)]
+            values = [values[k // 2] if k % 2 == 0 else new_values[k // 2] for k in range(n + 1)]
+        tail: Decimal = Decimal()
+        while len(coefficients) > 1 and tail + abs(coefficients[-1]) <= tolerance * scale:
+            tail += abs(coefficients.pop())
+        return cls(coefficients, a, b)
+
+    def _t(self, x: Decimal) -> Decimal:
+        return (2 * x - self.a - self.b) / (self.b - self.a)
+
+    def function(self, x: Decimal) -> Decimal:
+        # Clenshaw's recurrence: bₖ = cₖ + 2t·bₖ₊₁ - bₖ₊₂, the result is c₀ + t·b₁ - b₂
+        t: Decimal = self._t(x)
+        b_1, b_2 = Decimal(), Decimal()
+        for coefficient in reversed(self.coefficients[1:]):
+            b_1, b_2 = coefficient + 2 * t * b_1 - b_2, b_1
+        return self.coefficients[0] + t * b_1 - b_2
+
+    def differentiate(self) -> ChebyshevEquation:
+        # c'ⱼ₋₁ = c'ⱼ₊₁ + 2j·cⱼ, with c'₀ halved
+        n: int = len(self.coefficients) - 1
+        if n == 0:
+            return ChebyshevEquation([0], self.a, self.b)
+        result: list[Decimal] = [Decimal()] * (n + 2)
+        for j in range(n, 0, -1):
+            result[j - 1] = result[j + 1] + 2 * j * self.coefficients[j]
+        result[0] /= 2
+        scale: Decimal = 2 / (self.b - self.a)
+        return ChebyshevEquation([c * scale for c in result[:n]], self.a, self.b)
+
+    def antiderivative(self) -> ChebyshevEquation:
+        # Cⱼ = (cⱼ₋₁ - cⱼ₊₁) / 2j and C₁ = c₀ - c₂ / 2, with C₀ chosen to start from zero at a
+        coefficients: list[Decimal] = [2 * self.coefficients[0]] + self.coefficients[1:] + [Decimal(), Decimal()]
+        scale: Decimal = (self.b - self.a) / 2
+        result: list[Decimal] = [Decimal()] + [(coefficients[j - 1] - coefficients[j + 1]) / (2 * j) * scale
+                                               for j in range(1, len(self.coefficients) + 1)]
+        antiderivative = ChebyshevEquation(result, self.a, self.b)
+        antiderivative.coefficients[0] = -antiderivative.function(self.a)
+        return antiderivative
+
+    def integrate(self, a: NUMBER = None, b: NUMBER = None) -> Decimal:
+        a = self.a if a is None else number_to_decimal(a)
+        b = self.b if b is None else number_to_decimal(b)
+        if a == self.a and b == self.b:  # ∫T₂ₖ over [-1, 1] is 2 / (1 - 4k²), the odd ones vanish
+            return sum((c * 2 / (1 - j * j) for j, c in enumerate(self.coefficients) if j % 2 == 0),
+                       Decimal()) * (self.b - self.a) / 2
+        antiderivative: ChebyshevEquation = self.antiderivative()
+        return antiderivative.function(b) - antiderivative.function(a)
+
+    def derivative(self, x: Decimal) -> Decimal:
+        if self.derivative_series is None:
+            self.derivative_series = self.differentiate()
+        return self.derivative_series.function(x)
+
+    fixed_point = None
@@ -0,0 +1,182 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from enum import Enum
+from math import prod
+from random import Random
+from statistics import stdev
+
+from base import NUMBER, Row, ForkedPool, number_to_decimal, compensated_sum
+from .integrators import GaussLegendreIntegrator
+from .solvers import Solver, ParamSpec
+from .systems import FunctionProtocol
+
+
+@dataclass()
+class CubatureParamSpec(ParamSpec):
+    limits: list[tuple[NUMBER, NUMBER]]
+
+    def convert(self) -> list[tuple[Decimal, Decimal]]:
+        if len(self.limits) == 0:
+            raise ValueError("There must be at least one dimension")
+        return [(number_to_decimal(a), number_to_decimal(b)) for a, b in self.limits]
+
+
+class CubatureABS(Solver):
+    def __init__(self, processes: int = 1, batch_size: int = 1024, root_precision: int = None):
+        super().__init__(root_precision)
+        self.processes: int | None = processes
+        self.batch_size: int = batch_size
+        self.evaluations: int = 0
+
+    def _batch_sum(self, function: FunctionProtocol, limits: list[tuple[Decimal, Decimal]], start: int, stop: int,
+                   shift: tuple[float, ...]) -> Decimal:
+        raise NotImplementedError()
+
+    def _sum(self, function: FunctionProtocol, limits: list[tuple[Decimal, Decimal]], count: int,
+             shift: tuple[float, ...] = ()) -> Decimal:
+        # points are produced by the workers from their index ranges, the batches are summed in order:
+        # the worker count can't change the result
+        bounds: list[int] = list(range(0, count, self.batch_size)) + [count]
+
+        def batch_sum(batch: tuple[int, int]) -> Decimal:
+            return self._batch_sum(function, limits, *batch, shift)
+
+        self.evaluations += count
+        with ForkedPool(batch_sum, self.processes) as pool:
+            return compensated_sum(pool.imap(zip(bounds, bounds[1:])))
+
+    @staticmethod
+    def _scaled(limits: list[tuple[Decimal, Decimal]], unit_point: list[Decimal]) -> Row:
+        return Row([a + (b - a) * u for (a, b), u in zip(limits, unit_point)])
+
+    def solve_counted(self, function: FunctionProtocol, params: CubatureParamSpec) -> tuple[Decimal, int]:
+        raise NotImplementedError()
+
+
+class TensorGaussIntegrator(CubatureABS):
+    # orderᵈ evaluations: the exact rule for polynomials up to degree 2·order - 1 in every variable
+    def __init__(self, order: int = 10, processes: int = 1, batch_size: int = 1024, root_precision: int = None,
+                 cache_directory: str = None):
+        super().__init__(processes, batch_size, root_precision)
+        self.rule: GaussLegendreIntegrator = GaussLegendreIntegrator(1, order, root_precision, cache_directory)
+
+    def _batch_sum(self, function: FunctionProtocol, limits: list[tuple[Decimal, Decimal]], start: int, stop: int,
+                   shift: tuple[float, ...]) -> Decimal:
+        nodes, weights = self.rule.nodes()
+        order: int = len(nodes)
+
+        def terms():
+            for index in range(start, stop):
+                digits: list[int] = []
+                for _ in limits:
+                    index, digit = divmod(index, order)
+                    digits.append(digit)
+                unit_point: list[Decimal] = [(1 + nodes[digit]) / 2 for digit in digits]
+                yield prod((weights[digit] for digit in digits), start=Decimal(1)) * function(
+                    self._scaled(limits, unit_point))
+
+        return compensated_sum(terms())
+
+    def solve_counted(self, function: FunctionProtocol, params: CubatureParamSpec) -> tuple[Decimal, int]:
+        self.evaluations = 0
+        limits: list[tuple[Decimal, Decimal]] = params.convert()
+        points: int = self.rule.order ** len(limits)
+        volume: Decimal = prod(((b - a) / 2 for a, b in limits), start=Decimal(1))
+        return self._sum(function, limits, points) * volume, points
+
+
+class LowDiscrepancySequence(Enum):
+    SOBOL = "Sobol sequence"
+    HALTON = "Halton sequence"
+
+
+class QuasiMonteCarloIntegrator(CubatureABS):
+    bits = 32
+    # Joe and Kuo direction numbers (s, a, m₁...mₛ) for the dimensions after the first one
+    sobol_directions: list[tuple[int, int, list[int]]] = [
+        (1, 0, [1]), (2, 1, [1, 3]), (3, 1, [1, 3, 1]), (3, 2, [1, 1, 1]),
+        (4, 1, [1, 1, 3, 3]), (4, 4, [1, 3, 5, 13]), (5, 2, [1, 1, 5, 5, 17]),
+    ]
+    primes: list[int] = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53]
+
+    def __init__(self, points: int = 4096, shifts: int = 8, sequence: LowDiscrepancySequence = None,
+                 seed: int = None, processes: int = 1, batch_size: int = 1024, root_precision: int = None):
+        super().__init__(processes, batch_size, root_precision)
+        if shifts < 2:
+            raise ValueError("The error estimate needs at least two shifts")
+        self.points: int = points
+        self.shifts: int = shifts
+        self.sequence: LowDiscrepancySequence = sequence or LowDiscrepancySequence.SOBOL
+        self.seed: int | None = seed
+        self.error: Decimal = Decimal()
+
+    @classmethod
+    def _directions(cls, dimensions: int) -> list[list[int]]:
+        if dimensions > len(cls.sobol_directions) + 1:
+            raise ValueError(f"Sobol sequence is available for up to {len(cls.sobol_directions) + 1} dimensions")
+        result: list[list[int]] = [[1 << (cls.bits - k) for k in range(1, cls.bits + 1)]]
+        for s, a, m in cls.sobol_directions[:dimensions - 1]:
+            directions: list[int] = [m[k] << (cls.bits - k - 1) for k in range(s)]
+            for k in range(s, cls.bits):
+                direction: int = directions[k - s] ^ (directions[k - s] >> s)
+                for j in range(1, s):
+                    if (a >> (s - 1 - j)) & 1:
+                        direction ^= directions[k - j]
+                directions.append(direction)
+            result.append(directions)
+        return result
+
+    def _sobol(self, dimensions: int, start: int, stop: int, shift: tuple[float, ...]) -> list[list[float]]:
+        # the Gray code order: every next point differs from the previous one by a single direction,
+        # the shift is applied digitally (by XOR) to keep the net structure
+        digital_shift: list[int] = [int(s * (1 << self.bits)) for s in shift]
+        directions: list[list[int]] = self._directions(dimensions)
+        gray: int = start ^ (start >> 1)
+        state: list[int] = [0] * dimensions
+        for k in range(self.bits):
+            if (gray >> k) & 1:
+                for d in range(dimensions):
+                    state[d] ^= directions[d][k]
+        points: list[list[float]] = []
+        for index in range(start, stop):
+            points.append([(value ^ s) / (1 << self.bits) for value, s in zip(state, digital_shift)])
+            bit: int = (~index & (index + 1)).bit_length() - 1  # the lowest zero bit of the index
+            for d in range(dimensions):
+                state[d] ^= directions[d][bit]
+        return points
+
+    def _halton(self, dimensions: int, start: int, stop: int, shift: tuple[float, ...]) -> list[list[float]]:
+        if dimensions > len(self.primes):
+            raise ValueError(f"Halton sequence is available for up to {len(self.primes)} dimensions")
+        points: list[list[float]] = []
+        for index in range(start, stop):
+            point: list[float] = []
+            for base in self.primes[:dimensions]:
+                value, scale, rest = 0., 1., index + 1
+                while rest > 0:
+                    rest, digit = divmod(rest, base)
+                    scale /= base
+                    value += digit * scale
+                point.append(value)
+            points.append([(u + s) % 1 for u, s in zip(point, shift)])
+        return points
+
+    def _batch_sum(self, function: FunctionProtocol, limits: list[tuple[Decimal, Decimal]], start: int, stop: int,
+                   shift: tuple[float, ...]) -> Decimal:
+        generate = self._sobol if self.sequence == LowDiscrepancySequence.SOBOL else self._halton
+        return compensated_sum(function(self._scaled(limits, [Decimal.from_float(u) for u in point]))
+                               for point in generate(len(limits), start, stop, shift))
+
+    def solve_counted(self, function: FunctionProtocol, params: CubatureParamSpec) -> tuple[Decimal, int]:
+        # every random shift gives an unbiased estimate, their spread gives the error
+        self.evaluations = 0
+        limits: list[tuple[Decimal, Decimal]] = params.convert()
+        if self.sequence == LowDiscrepancySequence.SOBOL:
+            self._directions(len(limits))
+        random: Random = Random(self.seed)
+        shifts: list[tuple[float, ...]] = [tuple(random.random() for _ in limits) for _ in range(self.shifts)]
+        volume: Decimal = prod((b - a for a, b in limits), start=Decimal(1))
+        estimates: list[Decimal] = [self._sum(function, limits, self.points, shift) / self.points * volume
+                                    for shift in shifts]
+        self.error = Decimal.from_float(stdev(map(float, estimates)) / len(estimates) ** 0.5)
+        return compensated_sum(estimates) / len(estimates), self.points * self.shifts
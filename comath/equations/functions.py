@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from decimal import Decimal, DecimalException
+from decimal import Decimal, DecimalException, ROUND_CEILING
 from enum import Enum
 from math import *
 
-from base import NUMBER, number_to_decimal
+from base import NUMBER, number_to_decimal, decimal_pi
 from equations.interfaces import AnyEquation
 
 
@@ -23,6 +23,12 @@ class LinearEquation(AnyEquation):
     def fixed_point(self, x: Decimal) -> Decimal:
         return -self.b / self.k
 
+    def roots(self, a: Decimal, b: Decimal) -> list[Decimal] | None:
+        if self.k == 0:
+            return None if self.b == 0 else []
+        root: Decimal = -self.b / self.k
+        return [root] if a <= root <= b else []
+
 
 @dataclass
 class SquareEquation(AnyEquation):
@@ -116,6 +122,20 @@ class TrigonometricEquation(AnyEquation):
     def derivative(self, x: Decimal) -> Decimal:
         return Decimal.from_float(self.type.derive(x))
 
+    def breaks(self, a: Decimal, b: Decimal) -> list[Decimal]:
+        # poles at π/2 + kπ for tangent and secant, at kπ for cotangent and cosecant
+        if self.type in (TrigonometricEquationType.SIN, TrigonometricEquationType.COS):
+            return []
+        pi: Decimal = decimal_pi()
+        offset: Decimal = pi / 2 if self.type in (TrigonometricEquationType.TAN, TrigonometricEquationType.SEC) \
+            else Decimal()
+        k: Decimal = ((a - offset) / pi).to_integral_value(ROUND_CEILING)
+        result: list[Decimal] = []
+        while (x := offset + k * pi) <= b:
+            result.append(x)
+            k += 1
+        return result
+
     fixed_point = None
 
 
@@ -172,4 +192,7 @@ class SignEquation(AnyEquation):
             raise DecimalException()
         return Decimal()
 
+    def breaks(self, a: Decimal, b: Decimal) -> list[Decimal]:
+        return [Decimal()] if a <= 0 <= b else []
+
     fixed_point = None
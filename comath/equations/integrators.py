@@ -1,8 +1,15 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
-from decimal import Decimal, DecimalException
+from decimal import Decimal, DecimalException, ROUND_CEILING, getcontext
+from heapq import heappop, heappush
+from math import cos, pi
+from os import getpid, makedirs, path, replace
+from typing import Iterable
 
-from base import NUMBER, number_to_decimal
+from base import NUMBER, ForkedPool, number_to_decimal, decimal_pi, compensated_sum
 from .functions import AnyEquation
+from .reports import SolveReport, ProbedEquation
 from .solvers import Solver, ParamSpec
 
 
@@ -10,6 +17,7 @@ from .solvers import Solver, ParamSpec
 class IntegratorParamSpec(ParamSpec):
     right_limit: NUMBER
     left_limit: NUMBER
+    breaks: Iterable[NUMBER] = ()  # known discontinuities and singularities, in addition to the equation's own
 
     def convert(self) -> tuple[Decimal, Decimal]:
         right, left = map(number_to_decimal, (self.right_limit, self.left_limit))
@@ -18,6 +26,7 @@ class IntegratorParamSpec(ParamSpec):
 
 class Integrator(Solver):
     default_steps = 10000
+    open_rule = False  # the ends of the interval are never evaluated
 
     def __init__(self, separations: int = None, root_precision: int = None):
         super().__init__(root_precision)
@@ -29,28 +38,103 @@ class Integrator(Solver):
         except DecimalException:
             return (equation.function(x - self.precision) + equation.function(x + self.precision)) / 2
 
-    def _solve(self, equation: AnyEquation, a: Decimal, b: Decimal, step_size: Decimal) -> Decimal:
+    def _solve(self, equation: AnyEquation, a: Decimal, b: Decimal, step_size: Decimal) -> tuple[Decimal, int]:
+        # the integral over [a, b] and the separations it took
         raise NotImplementedError()
 
-    def solve(self, equation: AnyEquation, params: IntegratorParamSpec) -> Decimal:
+    def _report(self, probe: ProbedEquation, result: Decimal, steps: int, elapsed_time: int) -> SolveReport:
+        return probe.report(steps, elapsed_time)
+
+    def _break_rule(self) -> Integrator:
+        # a closed rule would evaluate the break itself, so the panels next to one are left to an open rule
+        rule: Integrator = TanhSinhIntegrator(self.precision)
+        rule.precision = self.precision
+        return rule
+
+    def _merge(self, rule: Integrator) -> None:
+        pass
+
+    def _solve_panel(self, equation: AnyEquation, a: Decimal, b: Decimal) -> Decimal:
+        rule: Integrator = self._break_rule()
+        result, _ = rule.solve_counted(equation, IntegratorParamSpec(a, b))
+        self._merge(rule)
+        return result
+
+    @staticmethod
+    def _separations(a: Decimal, b: Decimal, step_size: Decimal) -> int:
+        return int(((b - a) / step_size).to_integral_value())
+
+    def solve_counted(self, equation: AnyEquation, params: IntegratorParamSpec) -> tuple[Decimal, int]:
+        # the interval is split at the breaks, every part gets about the same step size
         a, b = params.convert()
-        step_size: Decimal = (b - a) / self.separations
-        return self._solve(equation, a, b, step_size)
+        if a == b:
+            return Decimal(), 0
+        low, high = sorted((a, b))
+        breaks: set[Decimal] = set(map(number_to_decimal, params.breaks)).union(equation.breaks(low, high))
+        points: list[Decimal] = [low] + sorted(x for x in breaks if low < x < high) + [high]
+        step_size: Decimal = (high - low) / self.separations
+        result: Decimal = Decimal()
+        steps: int = 0
+        for start, end in zip(points, points[1:]):
+            separations: int = max(1, int(((end - start) / step_size).to_integral_value(ROUND_CEILING)))
+            part_step: Decimal = (end - start) / separations
+            # only the end panels next to a break take the open rule, each of them counts as one separation
+            panels: list[tuple[Decimal, Decimal]] = []
+            if not self.open_rule and start in breaks:
+                panels.append((start, start + part_step))
+                start += part_step
+                separations -= 1
+            if not self.open_rule and end in breaks and separations > 0:
+                panels.append((end - part_step, end))
+                end -= part_step
+                separations -= 1
+            if separations > 0:
+                part, part_steps = self._solve(equation, start, end, part_step)
+                result += part
+                steps += part_steps
+            for panel in panels:
+                result += self._solve_panel(equation, *panel)
+                steps += 1
+        return (result if a < b else -result), steps
+
+
+class ChunkedIntegratorABS(Integrator):
+    default_chunks = 64
+
+    def __init__(self, separations: int = None, root_precision: int = None, processes: int = 1, chunks: int = None):
+        super().__init__(separations, root_precision)
+        self.processes: int | None = processes
+        self.chunks: int = chunks or self.default_chunks
+
+    def _solve_chunk(self, equation: AnyEquation, a: Decimal, step_size: Decimal, start: int, stop: int,
+                     separations: int) -> Decimal:
+        raise NotImplementedError()
+
+    def _solve(self, equation: AnyEquation, a: Decimal, b: Decimal, step_size: Decimal) -> tuple[Decimal, int]:
+        # chunks depend on the separations only, and are summed in order: the worker count can't change the result
+        separations: int = self._separations(a, b, step_size)
+        chunks: int = min(self.chunks, separations)
+        bounds: list[int] = [separations * k // chunks for k in range(chunks + 1)]
+
+        def solve_chunk(chunk: tuple[int, int]) -> Decimal:
+            return self._solve_chunk(equation, a, step_size, *chunk, separations)
 
+        with ForkedPool(solve_chunk, self.processes) as pool:
+            return compensated_sum(pool.map(zip(bounds, bounds[1:]))), separations
 
-class RectangleIntegratorABS(Integrator):
+
+class RectangleIntegratorABS(ChunkedIntegratorABS):
     default_steps = 1000000
 
     def _step_start(self, a: Decimal, step_size: Decimal):
         raise NotImplementedError()
 
-    def _solve(self, equation: AnyEquation, a: Decimal, b: Decimal, step_size: Decimal) -> Decimal:
-        result: Decimal = Decimal()
+    def _solve_chunk(self, equation: AnyEquation, a: Decimal, step_size: Decimal, start: int, stop: int,
+                     separations: int) -> Decimal:
+        # nodes are computed from the index, adding the step up would accumulate its rounding errors
         step_start: Decimal = self._step_start(a, step_size)
-        for _ in range(self.separations - 1):
-            result += self._function_or_break(equation, step_start) * step_size
-            step_start += step_size
-        return result
+        return compensated_sum(self._function_or_break(equation, step_start + i * step_size)
+                               for i in range(start, stop)) * step_size
 
 
 class RightRectangleIntegrator(RectangleIntegratorABS):
@@ -61,6 +145,8 @@ class RightRectangleIntegrator(RectangleIntegratorABS):
 
 
 class MiddleRectangleIntegrator(RectangleIntegratorABS):
+    open_rule = True
+
     def _step_start(self, a: Decimal, step_size: Decimal):
         return a + step_size / 2
 
@@ -72,35 +158,320 @@ class LeftRectangleIntegrator(RectangleIntegratorABS):
         return a + step_size
 
 
-class ComplexIntegratorABS(Integrator):
-    def _calc_step(self, f_start: Decimal, f_mid: Decimal, f_next: Decimal, half_step_size: Decimal):
+class ComplexIntegratorABS(ChunkedIntegratorABS):
+    nodes_per_step: int = 1
+    divider: int = 1
+
+    def _weight(self, j: int, nodes: int) -> int:
+        # the weight of the j-th node out of 0..nodes, in units of node spacing / divider
         raise NotImplementedError()
 
-    def _solve(self, equation: AnyEquation, a: Decimal, b: Decimal, step_size: Decimal) -> Decimal:
-        result: Decimal = Decimal()
-        step_size /= 2
-        step_start: Decimal = a
-        function_start: Decimal = self._function_or_break(equation, step_start)
-        function_next: Decimal
-        for _ in range(self.separations):
-            step_start += step_size
-            function_mid = self._function_or_break(equation, step_start)
-            step_start += step_size
-            function_next = self._function_or_break(equation, step_start)
-            result += self._calc_step(function_start, function_mid, function_next, step_size)
-            function_start = function_next
-        return result
+    def _solve_chunk(self, equation: AnyEquation, a: Decimal, step_size: Decimal, start: int, stop: int,
+                     separations: int) -> Decimal:
+        # every node is evaluated once: a chunk takes its first node, the last chunk takes the end node too
+        node_step: Decimal = step_size / self.nodes_per_step
+        nodes: int = separations * self.nodes_per_step
+        end: int = stop * self.nodes_per_step + (1 if stop == separations else 0)
+        return compensated_sum(self._weight(j, nodes) * self._function_or_break(equation, a + j * node_step)
+                               for j in range(start * self.nodes_per_step, end)) * node_step / self.divider
 
 
 class TrapezoidalIntegrator(ComplexIntegratorABS):
     default_steps = 10000
+    divider = 2
 
-    def _calc_step(self, f_start: Decimal, f_mid: Decimal, f_next: Decimal, half_step_size: Decimal):
-        return (f_start + f_next) * half_step_size
+    def _weight(self, j: int, nodes: int) -> int:
+        return 1 if j == 0 or j == nodes else 2
 
 
 class SimpsonsIntegrator(ComplexIntegratorABS):
     default_steps = 100
+    nodes_per_step = 2  # the ends and the midpoint of every step
+    divider = 3
+
+    def _weight(self, j: int, nodes: int) -> int:
+        return 1 if j == 0 or j == nodes else 4 if j % 2 == 1 else 2
+
+
+class AdaptiveIntegratorABS(Integrator):
+    default_steps = 2000  # the largest number of subintervals
+    default_tolerance = Decimal("1E-12")  # float-backed equations (e.g. trigonometric ones) can't get much closer
+
+    def __init__(self, tolerance: NUMBER = None, relative_tolerance: NUMBER = 0, max_intervals: int = None,
+                 root_precision: int = None):
+        super().__init__(max_intervals, root_precision)
+        self.tolerance: Decimal = number_to_decimal(tolerance) if tolerance is not None \
+            else self.default_tolerance if root_precision is None else self.precision
+        self.relative_tolerance: Decimal = number_to_decimal(relative_tolerance)
+        self.error: Decimal = Decimal()
+        self.evaluations: int = 0
+
+    def _evaluate(self, equation: AnyEquation, x: Decimal) -> Decimal:
+        self.evaluations += 1
+        return self._function_or_break(equation, x)
+
+    def _estimate(self, equation: AnyEquation, a: Decimal, b: Decimal, known: tuple | None) \
+            -> tuple[Decimal, Decimal, tuple | None, tuple | None]:
+        # the integral over [a, b], its error and the values reusable by both halves
+        raise NotImplementedError()
+
+    def _solve(self, equation: AnyEquation, a: Decimal, b: Decimal, step_size: Decimal) -> tuple[Decimal, int]:
+        # the interval with the largest error is split until the total error fits the tolerance
+        result, error, *known = self._estimate(equation, a, b, None)
+        intervals: list[tuple[Decimal, int, Decimal, Decimal, Decimal, list]] = [(-error, 0, a, b, result, known)]
+        while error > max(self.tolerance, self.relative_tolerance * abs(result)) \
+                and len(intervals) < self.separations:
+            interval_error, _, a, b, interval_result, (left_known, right_known) = heappop(intervals)
+            result -= interval_result
+            error += interval_error
+            middle: Decimal = (a + b) / 2
+            for a, b, known in ((a, middle, left_known), (middle, b, right_known)):
+                part_result, part_error, *part_known = self._estimate(equation, a, b, known)
+                heappush(intervals, (-part_error, self.evaluations, a, b, part_result, part_known))
+                result += part_result
+                error += part_error
+        self.error -= sum(interval[0] for interval in intervals)
+        return sum(interval[4] for interval in intervals), len(intervals)
+
+    def _break_rule(self) -> Integrator:
+        rule: Integrator = super()._break_rule()
+        rule.tolerance, rule.relative_tolerance = self.tolerance, self.relative_tolerance
+        return rule
+
+    def _merge(self, rule: AdaptiveIntegratorABS) -> None:
+        self.evaluations += rule.evaluations
+        self.error += rule.error
+
+    def solve_counted(self, equation: AnyEquation, params: IntegratorParamSpec) -> tuple[Decimal, int]:
+        self.evaluations = 0
+        self.error = Decimal()
+        return super().solve_counted(equation, params)
+
+
+class AdaptiveSimpsonsIntegrator(AdaptiveIntegratorABS):
+    def _estimate(self, equation: AnyEquation, a: Decimal, b: Decimal, known: tuple | None) \
+            -> tuple[Decimal, Decimal, tuple | None, tuple | None]:
+        middle: Decimal = (a + b) / 2
+        if known is None:
+            known = tuple(self._evaluate(equation, x) for x in (a, middle, b))
+        f_a, f_middle, f_b = known
+        f_left: Decimal = self._evaluate(equation, (a + middle) / 2)
+        f_right: Decimal = self._evaluate(equation, (middle + b) / 2)
+        whole: Decimal = (f_a + 4 * f_middle + f_b) * (b - a) / 6
+        halves: Decimal = (f_a + 4 * f_left + 2 * f_middle + 4 * f_right + f_b) * (b - a) / 12
+        # Richardson extrapolation: the error of the halves is about (halves - whole) / 15
+        return halves + (halves - whole) / 15, abs(halves - whole) / 15, \
+            (f_a, f_left, f_middle), (f_middle, f_right, f_b)
+
+
+class GaussKronrodIntegrator(AdaptiveIntegratorABS):
+    default_steps = 500
+    open_rule = True
+
+    # the 15-point Kronrod rule over [-1, 1], every other node of which forms the 7-point Gauss rule
+    kronrod_nodes: list[Decimal] = [Decimal(x) for x in (
+        "0.991455371120812639206854697526329", "0.949107912342758524526189684047851",
+        "0.864864423359769072789712788640926", "0.741531185599394439863864773280788",
+        "0.586087235467691130294144838258730", "0.405845151377397166906606412076961",
+        "0.207784955007898467600689403773245", "0")]
+    kronrod_weights: list[Decimal] = [Decimal(w) for w in (
+        "0.022935322010529224963732008058970", "0.063092092629978553290700663189204",
+        "0.104790010322250183839876322541518", "0.140653259715525918745189590510238",
+        "0.169004726639267902826583426598550", "0.190350578064785409913256402421014",
+        "0.204432940075298892414161999234649", "0.209482141084727828012999174891714")]
+    gauss_weights: list[Decimal] = [Decimal(w) for w in (
+        "0.129484966168869693270611432679082", "0.279705391489276667901467771423780",
+        "0.381830050505118944950369775488975", "0.417959183673469387755102040816327")]
+
+    def _estimate(self, equation: AnyEquation, a: Decimal, b: Decimal, known: tuple | None) \
+            -> tuple[Decimal, Decimal, tuple | None, tuple | None]:
+        center: Decimal = (a + b) / 2
+        radius: Decimal = (b - a) / 2
+        values: list[tuple[Decimal, ...]] = [(self._evaluate(equation, center - radius * x),
+                                              self._evaluate(equation, center + radius * x))
+                                             for x in self.kronrod_nodes[:-1]]
+        values.append((self._evaluate(equation, center),))
+        kronrod: Decimal = sum(w * sum(f) for w, f in zip(self.kronrod_weights, values))
+        gauss: Decimal = sum(w * sum(f) for w, f in zip(self.gauss_weights, values[1::2]))
+        mean: Decimal = kronrod / 2
+        deviation: Decimal = sum(w * sum(abs(y - mean) for y in f) for w, f in zip(self.kronrod_weights, values))
+        error: Decimal = abs(kronrod - gauss) * radius
+        if deviation != 0 and error != 0:  # the QUADPACK scaling, |K₁₅ - G₇| alone overestimates a lot
+            error = deviation * radius * min(1, (200 * error / (deviation * radius)) ** Decimal("1.5"))
+        return kronrod * radius, error, None, None
+
+
+class RombergIntegrator(AdaptiveIntegratorABS):
+    default_steps = 1 << 16
+    min_levels = 4  # coarse grids may agree by chance (e.g. on periodic functions)
+
+    def _solve(self, equation: AnyEquation, a: Decimal, b: Decimal, step_size: Decimal) -> tuple[Decimal, int]:
+        # trapezoids with halved steps reuse all the previous values, only the new midpoints are evaluated
+        separations: int = 1
+        step_size = b - a
+        trapezoid: Decimal = (self._evaluate(equation, a) + self._evaluate(equation, b)) * step_size / 2
+        row: list[Decimal] = [trapezoid]
+        error: Decimal = abs(trapezoid)
+        level: int = 0
+        while 2 * separations <= self.separations:
+            step_size /= 2
+            level += 1
+            trapezoid = trapezoid / 2 + step_size * sum(self._evaluate(equation, a + (2 * i + 1) * step_size)
+                                                        for i in range(separations))
+            separations *= 2
+            # Richardson extrapolation: R(k, j) = R(k, j - 1) + (R(k, j - 1) - R(k - 1, j - 1)) / (4ʲ - 1)
+            next_row: list[Decimal] = [trapezoid]
+            for j, previous in enumerate(row, 1):
+                next_row.append(next_row[-1] + (next_row[-1] - previous) / (4 ** j - 1))
+            # the rounding errors of the values stop the extrapolants from improving further at some level
+            stalled: bool = level > self.min_levels and abs(next_row[-1] - row[-1]) >= error
+            error = abs(next_row[-1] - row[-1])
+            row = next_row
+            if stalled or level >= self.min_levels \
+                    and error <= max(self.tolerance, self.relative_tolerance * abs(row[-1])):
+                break
+        self.error += error
+        return row[-1], separations
+
+
+class GaussLegendreIntegrator(Integrator):
+    default_steps = 1  # panels, each of them takes order evaluations
+    open_rule = True
+    nodes_cache: dict[tuple[int, int], tuple[list[Decimal], list[Decimal]]] = {}
+
+    def __init__(self, separations: int = None, order: int = 20, root_precision: int = None,
+                 cache_directory: str = None):
+        super().__init__(separations, root_precision)
+        if order < 1:
+            raise ValueError("Gauss-Legendre rule needs at least one node")
+        self.order: int = order
+        self.cache_directory: str | None = cache_directory
+
+    @staticmethod
+    def _legendre(n: int, x: Decimal) -> tuple[Decimal, Decimal]:
+        # Pₙ(x) and Pₙ'(x) by (k + 1)Pₖ₊₁ = (2k + 1)xPₖ - kPₖ₋₁
+        previous, current = Decimal(1), x
+        for k in range(1, n):
+            previous, current = current, ((2 * k + 1) * x * current - k * previous) / (k + 1)
+        return current, n * (x * current - previous) / (x * x - 1)
+
+    @classmethod
+    def _compute_nodes(cls, order: int) -> tuple[list[Decimal], list[Decimal]]:
+        if order == 1:
+            return [Decimal()], [Decimal(2)]
+        precision: Decimal = Decimal(f"1E-{getcontext().prec - 2}")
+        nodes: list[Decimal] = []
+        weights: list[Decimal] = []
+        for i in range(order):
+            # Newton's method from the asymptotic estimate, Decimal roots need just a few steps after it
+            x: Decimal = Decimal.from_float(cos(pi * (i + 0.75) / (order + 0.5)))
+            for _ in range(100):
+                value, derivative = cls._legendre(order, x)
+                offset: Decimal = value / derivative
+                x -= offset
+                if abs(offset) < precision:
+                    break
+            _, derivative = cls._legendre(order, x)
+            nodes.append(x)
+            weights.append(2 / ((1 - x * x) * derivative * derivative))
+        return nodes, weights
+
+    def _cache_file(self, order: int, precision: int) -> str:
+        return path.join(self.cache_directory, f"gauss_legendre_{order}_{precision}.txt")
+
+    def _load_nodes(self, order: int, precision: int) -> tuple[list[Decimal], list[Decimal]] | None:
+        if self.cache_directory is None or not path.isfile(self._cache_file(order, precision)):
+            return None
+        with open(self._cache_file(order, precision)) as f:
+            pairs: list[list[Decimal]] = [list(map(Decimal, line.split())) for line in f if line.strip() != ""]
+        if len(pairs) != order or any(len(pair) != 2 for pair in pairs):
+            return None
+        return [node for node, _ in pairs], [weight for _, weight in pairs]
+
+    def _save_nodes(self, order: int, precision: int, nodes: list[Decimal], weights: list[Decimal]):
+        if self.cache_directory is None:
+            return
+        makedirs(self.cache_directory, exist_ok=True)
+        temporary: str = f"{self._cache_file(order, precision)}.{getpid()}"
+        with open(temporary, "w") as f:
+            f.writelines(f"{node} {weight}\n" for node, weight in zip(nodes, weights))
+        replace(temporary, self._cache_file(order, precision))  # atomic, parallel writers don't clash
+
+    def nodes(self) -> tuple[list[Decimal], list[Decimal]]:
+        key: tuple[int, int] = (self.order, getcontext().prec)
+        if key not in self.nodes_cache:
+            loaded = self._load_nodes(*key)
+            if loaded is None:
+                loaded = self._compute_nodes(self.order)
+                self._save_nodes(*key, *loaded)
+            self.nodes_cache[key] = loaded
+        return self.nodes_cache[key]
+
+    def _solve(self, equation: AnyEquation, a: Decimal, b: Decimal, step_size: Decimal) -> tuple[Decimal, int]:
+        nodes, weights = self.nodes()
+        radius: Decimal = step_size / 2
+        result: Decimal = Decimal()
+        separations: int = self._separations(a, b, step_size)
+        for i in range(separations):
+            center: Decimal = a + (2 * i + 1) * radius
+            result += sum(weight * self._function_or_break(equation, center + radius * node)
+                          for node, weight in zip(nodes, weights))
+        return result * radius, separations
+
+
+class TanhSinhIntegrator(AdaptiveIntegratorABS):
+    default_steps = 1 << 7  # the smallest step is 1 / separations
+    open_rule = True
+    min_levels = 3
+    tables_cache: dict[tuple[int, int], list[tuple[Decimal, Decimal]]] = {}
+
+    @staticmethod
+    def _node(t: Decimal) -> tuple[Decimal, Decimal]:
+        # x = tanh(π/2 sinh t), w = π/2 cosh t / cosh²(π/2 sinh t), kept as the distance 1 - x to avoid cancellation
+        exp_t: Decimal = t.exp()
+        u: Decimal = decimal_pi() * (exp_t - 1 / exp_t) / 4
+        exp_2u: Decimal = (2 * u).exp()
+        distance: Decimal = 2 / (exp_2u + 1)
+        weight: Decimal = decimal_pi() * (exp_t + 1 / exp_t) / 4 * distance * distance * exp_2u
+        return distance, weight
+
+    @classmethod
+    def table(cls, level: int) -> list[tuple[Decimal, Decimal]]:
+        # nodes t = jh with h = 2⁻ˡᵉᵛᵉˡ, new ones only (odd j) for level > 0, until x can't be told from 1
+        key: tuple[int, int] = (level, getcontext().prec)
+        if key not in cls.tables_cache:
+            step_size: Decimal = Decimal(2) ** -level
+            smallest: Decimal = Decimal(f"1E-{2 * getcontext().prec}")
+            table: list[tuple[Decimal, Decimal]] = []
+            j: int = 1
+            while (node := cls._node(j * step_size))[0] >= smallest:
+                table.append(node)
+                j += 1 if level == 0 else 2
+            cls.tables_cache[key] = table
+        return cls.tables_cache[key]
+
+    def _level_sum(self, equation: AnyEquation, a: Decimal, b: Decimal, level: int) -> Decimal:
+        radius: Decimal = (b - a) / 2
+        result: Decimal = Decimal()
+        for distance, weight in self.table(level):
+            for x in (a + radius * distance, b - radius * distance):
+                if x != a and x != b:  # too close to the end to be represented, and the weight is negligible there
+                    result += weight * self._evaluate(equation, x)
+        return result * radius
 
-    def _calc_step(self, f_start: Decimal, f_mid: Decimal, f_next: Decimal, half_step_size: Decimal):
-        return (f_start + 4 * f_mid + f_next) * half_step_size / 3
+    def _solve(self, equation: AnyEquation, a: Decimal, b: Decimal, step_size: Decimal) -> tuple[Decimal, int]:
+        # halving the step only adds the nodes in between, the previous sum is reused
+        level: int = 0
+        result: Decimal = (decimal_pi() / 2 * self._evaluate(equation, (a + b) / 2) * (b - a) / 2
+                           + self._level_sum(equation, a, b, level))
+        error: Decimal = abs(result)
+        while 2 ** (level + 1) <= self.separations:
+            level += 1
+            previous: Decimal = result
+            result = previous / 2 + self._level_sum(equation, a, b, level) / 2 ** level
+            stalled: bool = level > self.min_levels and abs(result - previous) >= error
+            error = abs(result - previous)
+            if stalled or error <= max(self.tolerance, self.relative_tolerance * abs(result)):
+                break
+        self.error += error
+        return result, 2 ** level
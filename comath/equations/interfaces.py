@@ -35,28 +35,48 @@ class AnyEquation:
     def fixed_point_row(self, xs: Row) -> Row:
         return xs.map(lambda x: self.fixed_point(x))
 
+    def roots(self, a: Decimal, b: Decimal) -> list[Decimal] | None:
+        return None  # unknown
+
+    def breaks(self, a: Decimal, b: Decimal) -> list[Decimal]:
+        return []
+
+    def _breaks_with(self, *others: AnyEquation, roots_of: AnyEquation = None) -> BreaksFunction:
+        # breaks of a combined equation: the ones of its parts, and the roots of a denominator
+        def breaks(a: Decimal, b: Decimal) -> list[Decimal]:
+            result: set[Decimal] = set(self.breaks(a, b))
+            for other in others:
+                result.update(other.breaks(a, b))
+            if roots_of is not None:
+                result.update(roots_of.roots(a, b) or [])
+            return sorted(result)
+
+        return breaks
+
     def __call__(self, other: AnyEquation) -> AnyEquation:
         if not isinstance(other, AnyEquation):
             raise TypeError("")
 
         return LambdaEquation(lambda x: self.function(other.function(x)),
-                              lambda x: self.derivative(other.function(x)) * other.derivative(x))
+                              lambda x: self.derivative(other.function(x)) * other.derivative(x),
+                              breaks=other.breaks)
 
     def __invert__(self) -> AnyEquation:
         return LambdaEquation(self.derivative)
 
     def __pos__(self):
-        return LambdaEquation(self.function, self.derivative, self.fixed_point)
+        return LambdaEquation(self.function, self.derivative, self.fixed_point, breaks=self.breaks)
 
     def __neg__(self):
-        return LambdaEquation(lambda x: -self.function(x), lambda x: -self.derivative(x), self.fixed_point)
+        return LambdaEquation(lambda x: -self.function(x), lambda x: -self.derivative(x), self.fixed_point,
+                              breaks=self.breaks)
 
     def __add__(self, other: Decimal | AnyEquation):
         if isinstance(other, Decimal):
-            return LambdaEquation(lambda x: self.function(x) + other, self.derivative)
+            return LambdaEquation(lambda x: self.function(x) + other, self.derivative, breaks=self.breaks)
         if isinstance(other, AnyEquation):
             return LambdaEquation(lambda x: self.function(x) + other.function(other),
-                                  lambda x: self.derivative(x) + other.derivative(x))
+                                  lambda x: self.derivative(x) + other.derivative(x), breaks=self._breaks_with(other))
         raise TypeError("")
 
     def __radd__(self, other):
@@ -64,10 +84,10 @@ class AnyEquation:
 
     def __sub__(self, other: Decimal | AnyEquation):
         if isinstance(other, Decimal):
-            return LambdaEquation(lambda x: self.function(x) - other, self.derivative)
+            return LambdaEquation(lambda x: self.function(x) - other, self.derivative, breaks=self.breaks)
         if isinstance(other, AnyEquation):
             return LambdaEquation(lambda x: self.function(x) - other.function(other),
-                                  lambda x: self.derivative(x) - other.derivative(x))
+                                  lambda x: self.derivative(x) - other.derivative(x), breaks=self._breaks_with(other))
         raise TypeError("")
 
     def __rsub__(self, other):
@@ -75,13 +95,14 @@ class AnyEquation:
 
     def __mul__(self, other: Decimal | AnyEquation):
         if isinstance(other, Decimal):
-            return LambdaEquation(
-                lambda x: self.function(x) * other, lambda x: self.derivative(x) * other, self.fixed_point)
+            return LambdaEquation(lambda x: self.function(x) * other, lambda x: self.derivative(x) * other,
+                                  self.fixed_point, breaks=self.breaks)
         if isinstance(other, AnyEquation):
             def derivative(x: Decimal) -> Decimal:
                 return self.derivative(x) * other.function(x) + self.function(x) * other.derivative(x)
 
-            return LambdaEquation(lambda x: self.function(x) * other.function(other), derivative)
+            return LambdaEquation(lambda x: self.function(x) * other.function(other), derivative,
+                                  breaks=self._breaks_with(other))
         raise TypeError("")
 
     def __rmul__(self, other):
@@ -96,7 +117,8 @@ class AnyEquation:
                 result: Decimal = self.derivative(x) * other_function - self.function(x) * other.derivative(x)
                 return result / other_function ** 2
 
-            return LambdaEquation(lambda x: self.function(x) / other.function(x), derivative)
+            return LambdaEquation(lambda x: self.function(x) / other.function(x), derivative,
+                                  breaks=self._breaks_with(other, roots_of=other))
         raise TypeError("")
 
     def __rtruediv__(self, other: Decimal):
@@ -104,7 +126,8 @@ class AnyEquation:
             raise TypeError("")
 
         return LambdaEquation(lambda x: other / self.function(x),
-                              lambda x: -other * self.derivative(x) / self.function(x) ** 2)
+                              lambda x: -other * self.derivative(x) / self.function(x) ** 2,
+                              breaks=self._breaks_with(roots_of=self))
 
 
 class SimpleFunction(Protocol):
@@ -112,13 +135,20 @@ class SimpleFunction(Protocol):
         pass
 
 
+class BreaksFunction(Protocol):
+    def __call__(self, a: Decimal, b: Decimal) -> list[Decimal]:
+        pass
+
+
 class LambdaEquation(AnyEquation):
     def __init__(self, function: SimpleFunction, derivative: SimpleFunction = None,
-                 fixed_point: SimpleFunction = None, *, precision: int = 10):
+                 fixed_point: SimpleFunction = None, *, precision: int = 10, breaks: BreaksFunction = None):
         self.function: SimpleFunction = function
         self.fixed_point: SimpleFunction | None = fixed_point
         if derivative is not None:
             self.derivative: SimpleFunction = derivative
+        if breaks is not None:
+            self.breaks: BreaksFunction = breaks
         self.precision: Decimal = Decimal(f"1E-{precision}")
 
     def function(self, x: Decimal) -> Decimal:
@@ -0,0 +1,112 @@
+from cmath import rect
+from dataclasses import dataclass
+from decimal import Decimal
+from math import pi
+from typing import TypeAlias
+
+from base import ComplexDecimal
+from .functions import PolynomialEquation
+from .reports import SolveReport, ProbedEquation
+from .solvers import DifferentialSolver, ParamSpec
+
+COMPLEX: TypeAlias = ComplexDecimal | complex
+
+
+@dataclass()
+class PolynomialParamSpec(ParamSpec):
+    initial_guesses: list[COMPLEX] | None = None
+
+    def convert(self) -> list[COMPLEX] | None:
+        if self.initial_guesses is None:
+            return None
+        return list(self.initial_guesses)
+
+
+class AberthSolver(DifferentialSolver):
+    float_precision: Decimal = Decimal("1E-14")
+
+    def __init__(self, max_steps: int = None, root_precision: int = None, decimal_mode: bool = True):
+        super().__init__(max_steps, root_precision)
+        self.decimal_mode: bool = decimal_mode
+        if not decimal_mode:
+            self.precision = max(self.precision, self.float_precision)
+
+    def _convert(self, value: COMPLEX | Decimal) -> COMPLEX:
+        if self.decimal_mode:
+            return ComplexDecimal.convert(value)
+        return complex(value)
+
+    @staticmethod
+    def _cauchy_bound(coefficients: list[COMPLEX]) -> float:
+        # the only positive root of |a₀|xⁿ - |a₁|xⁿ⁻¹ - ... - |aₙ|, all roots lie within it
+        moduli: list[float] = [float(abs(c)) for c in coefficients]
+        moduli = [moduli[0]] + [-m for m in moduli[1:]]
+        x: float = 1 + max(-m / moduli[0] for m in moduli[1:])
+        for _ in range(100):
+            result, derivative = AberthSolver._evaluate(moduli, x)
+            if derivative == 0 or result <= 0:
+                break
+            x_next = x - result / derivative
+            if x_next >= x:
+                break
+            x = x_next
+        return x
+
+    def _initial_guesses(self, coefficients: list[COMPLEX]) -> list[COMPLEX]:
+        n: int = len(coefficients) - 1
+        radius: float = self._cauchy_bound(coefficients)
+        polar = ComplexDecimal.from_polar if self.decimal_mode else rect
+        return [polar(radius, 2 * pi * k / n + pi / (2 * n)) for k in range(n)]
+
+    @staticmethod
+    def _evaluate(coefficients: list[COMPLEX], z: COMPLEX) -> tuple[COMPLEX, COMPLEX]:
+        result: COMPLEX = coefficients[0]
+        derivative: COMPLEX = coefficients[0] * 0
+        for coefficient in coefficients[1:]:
+            derivative = derivative * z + result
+            result = result * z + coefficient
+        return result, derivative
+
+    def _iterate(self, coefficients: list[COMPLEX], roots: list[COMPLEX]) -> tuple[list[COMPLEX], int]:
+        step: int = 0
+        while self.max_steps is None or step < self.max_steps:
+            largest_offset = 0
+            for k in range(len(roots)):
+                p, dp = self._evaluate(coefficients, roots[k])
+                if abs(p) == 0 or abs(dp) == 0:
+                    continue
+                ratio: COMPLEX = p / dp
+                repulsion: COMPLEX = sum((1 / (roots[k] - roots[j]) for j in range(len(roots)) if j != k), 0 * ratio)
+                offset: COMPLEX = ratio / (1 - ratio * repulsion)
+                roots[k] = roots[k] - offset  # updated in place: the next roots already see it
+                largest_offset = max(largest_offset, abs(offset) / max(1, abs(roots[k])))
+            step += 1
+            if largest_offset < self.precision:
+                break
+        return sorted(roots, key=lambda z: (z.real, z.imag)), step
+
+    def solve(self, equation: PolynomialEquation, params: PolynomialParamSpec = None) -> list[COMPLEX]:
+        return self.solve_counted(equation, params)[0]
+
+    def solve_counted(self, equation: PolynomialEquation, params: PolynomialParamSpec = None) \
+            -> tuple[list[COMPLEX], int]:
+        coefficients: list[COMPLEX] = [self._convert(c) for c in equation.coefficients]
+        while len(coefficients) > 1 and abs(coefficients[0]) == 0:  # the degree is set by the senior non-zero one
+            coefficients.pop(0)
+        if len(coefficients) < 2:
+            raise ValueError("Polynomial must have a non-zero coefficient besides the free one")
+        guesses: list[COMPLEX] | None = None if params is None else params.convert()
+        if guesses is None:
+            guesses = self._initial_guesses(coefficients)
+        elif len(guesses) != len(coefficients) - 1:
+            raise ValueError(f"Polynomial of degree {len(coefficients) - 1} can't have {len(guesses)} roots")
+        return self._iterate(coefficients, [self._convert(z) for z in guesses])
+
+    def _report(self, probe: ProbedEquation, result: list[COMPLEX], steps: int, elapsed_time: int) -> SolveReport:
+        # the roots are polished against the coefficients, the residual is the largest |p(z)| over them
+        coefficients: list[COMPLEX] = [self._convert(c) for c in probe.coefficients]
+        residual: float | Decimal = max((abs(self._evaluate(coefficients, z)[0]) for z in result), default=0)
+        return probe.report(steps, elapsed_time, residual if self.decimal_mode else Decimal.from_float(residual))
+
+    def refine(self, equation: PolynomialEquation, roots: list[COMPLEX]) -> list[COMPLEX]:
+        return self.solve(equation, PolynomialParamSpec(roots))
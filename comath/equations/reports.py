@@ -0,0 +1,81 @@
+from collections import deque
+from dataclasses import dataclass, field
+from decimal import Decimal, DecimalException
+
+from .interfaces import AnyEquation
+
+
+@dataclass()
+class SolveReport:
+    iterations: int
+    function_evaluations: int
+    derivative_evaluations: int
+    fixed_point_evaluations: int
+    elapsed_time: int  # ns
+    residual: Decimal | None = None
+    convergence_rate: Decimal | None = None
+    trace: list[tuple[Decimal, Decimal]] = field(default_factory=list)
+
+    @property
+    def evaluations(self) -> int:
+        return self.function_evaluations + self.derivative_evaluations + self.fixed_point_evaluations
+
+
+class ProbedEquation(AnyEquation):
+    def __init__(self, equation: AnyEquation, trace_size: int = 0):
+        self.equation: AnyEquation = equation
+        self.function_evaluations: int = 0
+        self.derivative_evaluations: int = 0
+        self.fixed_point_evaluations: int = 0
+        self.trace: deque[tuple[Decimal, Decimal]] = deque(maxlen=trace_size)
+        self.last_xs: deque[Decimal] = deque(maxlen=4)
+        if equation.fixed_point is None:
+            self.fixed_point = None
+
+    def __getattr__(self, name: str):
+        # anything besides the evaluations (e.g. PolynomialEquation.coefficients) comes from the wrapped equation
+        if name == "equation":
+            raise AttributeError(name)
+        return getattr(self.equation, name)
+
+    def function(self, x: Decimal) -> Decimal:
+        self.function_evaluations += 1
+        result: Decimal = self.equation.function(x)
+        self.trace.append((x, result))
+        self.last_xs.append(x)
+        return result
+
+    def derivative(self, x: Decimal) -> Decimal:
+        self.derivative_evaluations += 1
+        return self.equation.derivative(x)
+
+    def fixed_point(self, x: Decimal) -> Decimal:
+        self.fixed_point_evaluations += 1
+        return self.equation.fixed_point(x)
+
+    def roots(self, a: Decimal, b: Decimal) -> list[Decimal] | None:
+        return self.equation.roots(a, b)
+
+    def breaks(self, a: Decimal, b: Decimal) -> list[Decimal]:
+        return self.equation.breaks(a, b)
+
+    def residual(self, x: Decimal) -> Decimal | None:
+        try:
+            return abs(self.equation.function(x))
+        except DecimalException:
+            return None
+
+    def convergence_rate(self) -> Decimal | None:
+        # q ≈ ln(eₙ₊₁ / eₙ) / ln(eₙ / eₙ₋₁) with eₙ = |xₙ₊₁ - xₙ| over the last evaluated points
+        if len(self.last_xs) < 4:
+            return None
+        xs = list(self.last_xs)
+        errors = [abs(xs[i + 1] - xs[i]) for i in range(3)]
+        if any(error == 0 for error in errors) or errors[1] == errors[0]:
+            return None
+        return (errors[2] / errors[1]).ln() / (errors[1] / errors[0]).ln()
+
+    def report(self, iterations: int, elapsed_time: int, residual: Decimal | None = None,
+               convergence_rate: Decimal | None = None) -> SolveReport:
+        return SolveReport(iterations, self.function_evaluations, self.derivative_evaluations,
+                           self.fixed_point_evaluations, elapsed_time, residual, convergence_rate, list(self.trace))
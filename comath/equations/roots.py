@@ -0,0 +1,88 @@
+from decimal import Decimal
+
+from base import Row, ForkedPool
+from .interfaces import AnyEquation
+from .solvers import StraightSolverABS, StraightParamSpec
+
+
+class RootIsolator:
+    def __init__(self, solver: StraightSolverABS, samples: int = 1000, max_depth: int = 64,
+                 root_precision: int = None, processes: int = 1, chunk_size: int = 16):
+        self.solver: StraightSolverABS = solver
+        self.samples: int = samples
+        self.max_depth: int = max_depth
+        self.precision: Decimal = Decimal(f"1E-{root_precision or 10}")
+        self.processes: int | None = processes
+        self.chunk_size: int = chunk_size
+
+    def _refine(self, equation: AnyEquation, a: Decimal, b: Decimal,
+                brackets: list[tuple[Decimal, Decimal]], roots: list[Decimal]) -> None:
+        # |f| has a local minimum in (a, b) without a sign change: zoom in around
+        # the minimum until the sign changes or the interval becomes too small
+        for _ in range(self.max_depth):
+            xs = Row.linearly_spaced(a, b, 4)
+            ys = equation.protected_function_row(xs)
+            if any(y is None for y in ys):
+                return
+
+            zeros = [xs[i] for i in range(1, xs.size - 1) if ys[i] == 0]
+            changes = [(xs[i], xs[i + 1]) for i in range(xs.size - 1)
+                       if ys[i] != 0 and ys[i + 1] != 0 and ys[i].is_signed() != ys[i + 1].is_signed()]
+            if len(zeros) != 0 or len(changes) != 0:
+                roots.extend(zeros)
+                brackets.extend(changes)
+                return
+
+            i = min(range(1, xs.size - 1), key=lambda k: abs(ys[k]))
+            a, b = xs[i - 1], xs[i + 1]
+            if b - a < self.precision:
+                if self.solver.is_root(ys[i]):
+                    roots.append(xs[i])
+                return
+
+    def isolate(self, equation: AnyEquation, params: StraightParamSpec) \
+            -> tuple[list[tuple[Decimal, Decimal]], list[Decimal]]:
+        a, b = sorted(params.convert())
+        xs = Row.linearly_spaced(a, b, self.samples)
+        ys = equation.protected_function_row(xs)
+        brackets: list[tuple[Decimal, Decimal]] = []
+        roots: list[Decimal] = []
+
+        for i in range(xs.size):
+            if ys[i] is None:
+                continue
+            if ys[i] == 0:
+                roots.append(xs[i])  # another root might hide right next to this one
+                for j in (i - 1, i + 1):
+                    if 0 <= j < xs.size and ys[j] is not None and ys[j] != 0:
+                        self._refine(equation, min(xs[i], xs[j]), max(xs[i], xs[j]), brackets, roots)
+            elif i + 1 < xs.size and ys[i + 1] is not None and ys[i + 1] != 0 \
+                    and ys[i].is_signed() != ys[i + 1].is_signed():
+                brackets.append((xs[i], xs[i + 1]))
+            elif 0 < i < xs.size - 1 and ys[i - 1] is not None and ys[i + 1] is not None \
+                    and ys[i - 1].is_signed() == ys[i].is_signed() == ys[i + 1].is_signed() \
+                    and abs(ys[i]) <= abs(ys[i - 1]) and abs(ys[i]) <= abs(ys[i + 1]):
+                self._refine(equation, xs[i - 1], xs[i + 1], brackets, roots)
+
+        return brackets, roots
+
+    def _deduplicate(self, roots: list[Decimal]) -> list[Decimal]:
+        result: list[Decimal] = []
+        for root in sorted(roots):
+            if len(result) == 0 or root - result[-1] > self.precision:
+                result.append(root)
+        return result
+
+    def solve(self, equation: AnyEquation, params: StraightParamSpec) -> list[Decimal]:
+        brackets, roots = self.isolate(equation, params)
+
+        def solve_bracket(bracket: tuple[Decimal, Decimal]) -> Decimal | None:
+            root: Decimal = self.solver.solve(equation, StraightParamSpec(*bracket))
+            y: Decimal | None = equation.protected_function(root)
+            if y is None or abs(y) > min(abs(equation.function(x)) for x in bracket):
+                return None  # poles change sign too
+            return root
+
+        with ForkedPool(solve_bracket, self.processes, self.chunk_size) as pool:
+            roots.extend(root for root in pool.imap(brackets) if root is not None)
+        return self._deduplicate(roots)
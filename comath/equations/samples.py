@@ -0,0 +1,89 @@
+from decimal import Decimal
+from typing import Iterable, Iterator, TypeAlias
+
+from base import NUMBER, Row, number_to_decimal
+
+SAMPLE: TypeAlias = tuple[NUMBER, NUMBER]
+POINT: TypeAlias = tuple[Decimal, Decimal]
+
+
+class SampleIntegrator:
+    # integrates (x, y) samples sorted by x on any grid, keeping only a few of them in memory at once
+    def _points(self, samples: Iterable[SAMPLE]) -> Iterator[POINT]:
+        previous: Decimal | None = None
+        for x, y in samples:
+            x = number_to_decimal(x)
+            if previous is not None and x <= previous:
+                raise ValueError("Samples must be sorted by x without repeats")
+            previous = x
+            yield x, number_to_decimal(y)
+
+    def cumulative(self, samples: Iterable[SAMPLE]) -> Iterator[POINT]:
+        # the running integral: (x, ∫ from the first x to this one) for every sample
+        raise NotImplementedError()
+
+    def cumulative_rows(self, xs: Row, ys: Row) -> Row:
+        if xs.size != ys.size:
+            raise ValueError("Rows must have the same size")
+        return Row([result for _, result in self.cumulative(zip(xs, ys))])
+
+    def integrate(self, samples: Iterable[SAMPLE]) -> Decimal:
+        result: Decimal = Decimal()
+        for _, result in self.cumulative(samples):
+            pass
+        return result
+
+    def integrate_rows(self, xs: Row, ys: Row) -> Decimal:
+        if xs.size != ys.size:
+            raise ValueError("Rows must have the same size")
+        return self.integrate(zip(xs, ys))
+
+
+class TrapezoidalSampleIntegrator(SampleIntegrator):
+    def cumulative(self, samples: Iterable[SAMPLE]) -> Iterator[POINT]:
+        result: Decimal = Decimal()
+        previous: POINT | None = None
+        for x, y in self._points(samples):
+            if previous is not None:
+                result += (previous[1] + y) * (x - previous[0]) / 2
+            yield x, result
+            previous = x, y
+
+
+class SimpsonsSampleIntegrator(SampleIntegrator):
+    @staticmethod
+    def _pair(f_0: Decimal, f_1: Decimal, f_2: Decimal, h_0: Decimal, h_1: Decimal) -> Decimal:
+        # the parabola through three points of a non-uniform grid, integrated over both intervals
+        return (h_0 + h_1) / 6 * ((2 - h_1 / h_0) * f_0 + (h_0 + h_1) ** 2 / (h_0 * h_1) * f_1 + (2 - h_0 / h_1) * f_2)
+
+    @staticmethod
+    def _first_part(f_0: Decimal, f_1: Decimal, f_2: Decimal, h_0: Decimal, h_1: Decimal) -> Decimal:
+        # the same parabola over the first interval only: h / 12 (5f₀ + 8f₁ - f₂) on a uniform grid
+        return ((2 * h_0 ** 2 + 3 * h_0 * h_1) / (6 * (h_0 + h_1)) * f_0 + (h_0 ** 2 + 3 * h_0 * h_1) / (6 * h_1) * f_1
+                - h_0 ** 3 / (6 * h_1 * (h_0 + h_1)) * f_2)
+
+    def cumulative(self, samples: Iterable[SAMPLE]) -> Iterator[POINT]:
+        # pairs of intervals are integrated at once, the middle point is yielded as soon as the pair ends
+        result: Decimal = Decimal()
+        window: list[POINT] = []
+        before: POINT | None = None
+        for point in self._points(samples):
+            if len(window) < 2:
+                if len(window) == 0:
+                    yield point[0], result
+                window.append(point)
+                continue
+            (x_0, f_0), (x_1, f_1), (x_2, f_2) = *window, point
+            yield x_1, result + self._first_part(f_0, f_1, f_2, x_1 - x_0, x_2 - x_1)
+            result += self._pair(f_0, f_1, f_2, x_1 - x_0, x_2 - x_1)
+            yield x_2, result
+            before = x_1, f_1
+            window = [point]
+        if len(window) == 2:  # an odd interval count: the last one uses the parabola through the previous pair
+            (x_1, f_1), (x_2, f_2) = window
+            if before is None:
+                result += (f_1 + f_2) * (x_2 - x_1) / 2
+            else:
+                x_0, f_0 = before
+                result += self._first_part(f_2, f_1, f_0, x_2 - x_1, x_1 - x_0)
+            yield x_2, result
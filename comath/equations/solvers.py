@@ -2,9 +2,11 @@ from abc import ABC
 from dataclasses import dataclass
 from decimal import Decimal
 from enum import Enum
+from time import time_ns
 
-from base import NUMBER, number_to_decimal
+from base import NUMBER, number_to_decimal, beautify_decimal
 from .interfaces import AnyEquation
+from .reports import SolveReport, ProbedEquation
 
 
 class SolveMethod(Enum):
@@ -12,6 +14,8 @@ class SolveMethod(Enum):
     SECANT = "Secant method"
     NEWTON = "Newton's (tangent) method"
     ITERATION = "Fixed-point iteration method"
+    STEFFENSEN = "Steffensen's (accelerated fixed-point) method"
+    BRENT = "Brent's method"
 
 
 class ParamSpec:
@@ -24,8 +28,24 @@ class Solver:
         self.precision: Decimal = Decimal(f"1E-{root_precision or 20}")
 
     def solve(self, equation: AnyEquation, params: ParamSpec) -> Decimal:
+        return self.solve_counted(equation, params)[0]
+
+    def solve_counted(self, equation: AnyEquation, params: ParamSpec) -> tuple[Decimal, int]:
+        # the result and the number of steps it took: nothing of a single solve is kept in the solver,
+        # so one instance can be shared by batches and pools
         raise NotImplementedError()
 
+    def _report(self, probe: ProbedEquation, result: Decimal, steps: int, elapsed_time: int) -> SolveReport:
+        return probe.report(steps, elapsed_time, probe.residual(result), probe.convergence_rate())
+
+    def solve_with_report(self, equation: AnyEquation, params: ParamSpec, trace_size: int = 0) \
+            -> tuple[Decimal, SolveReport]:
+        probe = ProbedEquation(equation, trace_size)
+        elapsed_time: int = time_ns()
+        result, steps = self.solve_counted(probe, params)
+        elapsed_time = time_ns() - elapsed_time
+        return result, self._report(probe, result, steps, elapsed_time)
+
 
 class DifferentialSolver(Solver, ABC):
     def __init__(self, max_steps: int = None, root_precision: int = None):
@@ -50,17 +70,8 @@ class StraightSolverABS(DifferentialSolver):
     def _solve(self, equation: AnyEquation, a: Decimal, f_a: Decimal, b: Decimal, f_b: Decimal) -> Decimal:
         raise NotImplementedError()
 
-    def solve(self, equation: AnyEquation, params: StraightParamSpec) -> Decimal:
-        a, b = params.convert()
-        f_a: Decimal = equation.function(a)
-        f_b: Decimal = equation.function(b)
-        if f_a == 0:
-            return a
-        if f_b == 0:
-            return b
-        if f_a * f_b > 0:
-            raise ValueError("Can't find roots with given borders")
-
+    def _iterate(self, equation: AnyEquation, a: Decimal, f_a: Decimal, b: Decimal, f_b: Decimal) \
+            -> tuple[Decimal, int]:
         step: int = 0
         xi = self._solve(equation, a, f_a, b, f_b)
         f_xi: Decimal = equation.function(xi)
@@ -72,7 +83,19 @@ class StraightSolverABS(DifferentialSolver):
             xi = self._solve(equation, a, f_a, b, f_b)
             f_xi: Decimal = equation.function(xi)
             step += 1
-        return xi
+        return xi, step
+
+    def solve_counted(self, equation: AnyEquation, params: StraightParamSpec) -> tuple[Decimal, int]:
+        a, b = params.convert()
+        f_a: Decimal = equation.function(a)
+        f_b: Decimal = equation.function(b)
+        if f_a == 0:
+            return a, 0
+        if f_b == 0:
+            return b, 0
+        if f_a * f_b > 0:
+            raise ValueError("Can't find roots with given borders")
+        return self._iterate(equation, a, f_a, b, f_b)
 
 
 class BisectionSolver(StraightSolverABS):
@@ -85,6 +108,46 @@ class SecantSolver(StraightSolverABS):
         return a - (f_a * (b - a)) / (f_b - f_a)
 
 
+class BrentSolver(StraightSolverABS):
+    def _interpolate(self, a: Decimal, f_a: Decimal, b: Decimal, f_b: Decimal, c: Decimal, f_c: Decimal) -> Decimal:
+        if f_a != f_c and f_b != f_c:  # inverse quadratic interpolation
+            return (a * f_b * f_c / ((f_a - f_b) * (f_a - f_c))
+                    + b * f_a * f_c / ((f_b - f_a) * (f_b - f_c))
+                    + c * f_a * f_b / ((f_c - f_a) * (f_c - f_b)))
+        return b - f_b * (b - a) / (f_b - f_a)  # secant
+
+    def _iterate(self, equation: AnyEquation, a: Decimal, f_a: Decimal, b: Decimal, f_b: Decimal) \
+            -> tuple[Decimal, int]:
+        if abs(f_a) < abs(f_b):
+            a, f_a, b, f_b = b, f_b, a, f_a
+        c, f_c = a, f_a
+        d: Decimal = c
+        bisected: bool = True
+
+        step: int = 0
+        while not self.is_root(f_b) and abs(b - a) >= self.precision \
+                and (self.max_steps is None or step < self.max_steps):
+            s: Decimal = self._interpolate(a, f_a, b, f_b, c, f_c)
+            last_step: Decimal = abs(b - c) if bisected else abs(c - d)
+            if not min((3 * a + b) / 4, b) < s < max((3 * a + b) / 4, b) \
+                    or abs(s - b) >= last_step / 2 or last_step < self.precision:
+                s = (a + b) / 2
+                bisected = True
+            else:
+                bisected = False
+
+            f_s: Decimal = equation.function(s)
+            d, c, f_c = c, b, f_b
+            if f_a.is_signed() != f_s.is_signed():
+                b, f_b = s, f_s
+            else:
+                a, f_a = s, f_s
+            if abs(f_a) < abs(f_b):
+                a, f_a, b, f_b = b, f_b, a, f_a
+            step += 1
+        return b, step
+
+
 @dataclass()
 class IterativeParamSpec(ParamSpec):
     initial_guess: NUMBER
@@ -94,18 +157,34 @@ class IterativeParamSpec(ParamSpec):
 
 
 class IterativeSolverABS(DifferentialSolver):
+    divergence_steps: int | None = None
+
     def _solve(self, equation: AnyEquation, x_n: Decimal, f_x_n: Decimal) -> Decimal:
         raise NotImplementedError()
 
-    def solve(self, equation: AnyEquation, params: IterativeParamSpec) -> Decimal:
+    def solve_counted(self, equation: AnyEquation, params: IterativeParamSpec) -> tuple[Decimal, int]:
         step: int = 0
+        stalled_steps: int = 0
+        smallest_delta: Decimal | None = None
         x_n = params.convert()
         f_n = equation.function(x_n)
         while not self.is_root(f_n) and (self.max_steps is None or step < self.max_steps):
-            x_n = self._solve(equation, x_n, f_n)
+            x_next: Decimal = self._solve(equation, x_n, f_n)
+            delta_next: Decimal = abs(x_next - x_n)
+            if self.divergence_steps is not None:
+                if delta_next == 0:
+                    break  # stagnated: no further step can change anything
+                # |xₙ₊₁ - xₙ| / |xₙ - xₙ₋₁| estimates |g'(x)|: while it's < 1 every step is the shortest so far
+                if smallest_delta is None or delta_next < smallest_delta:
+                    smallest_delta, stalled_steps = delta_next, 0
+                else:
+                    stalled_steps += 1
+                if stalled_steps >= self.divergence_steps:
+                    raise ValueError(f"Iterations diverge near {beautify_decimal(x_next)}")
+            x_n = x_next
             f_n = equation.function(x_n)
             step += 1
-        return x_n
+        return x_n, step
 
 
 class NewtonSolver(IterativeSolverABS):
@@ -114,7 +193,19 @@ class NewtonSolver(IterativeSolverABS):
 
 
 class IterationSolver(IterativeSolverABS):
+    divergence_steps = 10
+
     def _solve(self, equation: AnyEquation, x_n: Decimal, f_n: Decimal) -> Decimal:
         if equation.fixed_point is None:
             raise ValueError("")
         return equation.fixed_point(x_n)  # noqa
+
+
+class SteffensenSolver(IterationSolver):
+    def _solve(self, equation: AnyEquation, x_n: Decimal, f_n: Decimal) -> Decimal:
+        g_x: Decimal = super()._solve(equation, x_n, f_n)
+        g_g_x: Decimal = super()._solve(equation, g_x, f_n)
+        divider: Decimal = g_g_x - 2 * g_x + x_n
+        if divider == 0:
+            return g_g_x
+        return x_n - (g_x - x_n) ** 2 / divider  # Aitken's Δ² over xₙ, g(xₙ), g(g(xₙ))
@@ -1,7 +1,8 @@
 from decimal import Decimal
-from typing import Protocol
+from enum import Enum
+from typing import Protocol, Iterable
 
-from base import Row, LinearEquationSystem
+from base import Row, Matrix, LinearEquationSystem, SparseLinearEquationSystem, ForkedPool
 
 
 class FunctionProtocol(Protocol):
@@ -14,9 +15,20 @@ class DerivativeProtocol(Protocol):
         pass
 
 
+class VectorFunctionProtocol(Protocol):
+    def __call__(self, x: Row) -> Row:
+        pass
+
+
+class JacobianProtocol(Protocol):
+    def __call__(self, x: Row) -> Matrix:
+        pass
+
+
 class MultiEquation:
     def __init__(self, function: FunctionProtocol, derivative: DerivativeProtocol = None, *, precision: int = 10):
         self.function: FunctionProtocol = function
+        self.has_derivative: bool = derivative is not None
         if derivative is not None:
             self.derivative: DerivativeProtocol = derivative
         self.precision: Decimal = Decimal(f"1E-{precision}")
@@ -27,7 +39,15 @@ class MultiEquation:
         return (self.function(x_moved) - self.function(x)) / self.precision
 
 
+class SystemSolveMethod(Enum):
+    NEWTON = "Newton's method"
+    CHORD = "Chord method (Jacobian reuse)"
+    BROYDEN = "Broyden's method"
+
+
 class EquationSystem:
+    contraction: Decimal = Decimal("0.5")
+
     @staticmethod
     def _unpack_equation(equation: FunctionProtocol | tuple[FunctionProtocol, DerivativeProtocol]) -> tuple:
         if isinstance(equation, tuple):
@@ -35,11 +55,25 @@ class EquationSystem:
         return tuple([equation])
 
     def __init__(self, *equations: FunctionProtocol | tuple[FunctionProtocol, DerivativeProtocol],
-                 precision: int = 10, max_steps: int = 10000):
+                 precision: int = 10, max_steps: int = 10000,
+                 method: SystemSolveMethod = SystemSolveMethod.NEWTON, jacobian_reuse: int = 5,
+                 sparsity: list[Iterable[int]] = None, detect_sparsity: bool = False, processes: int = 1):
         self.equations: list[MultiEquation] = [MultiEquation(*self._unpack_equation(equation), precision=precision)
                                                for equation in equations]
         self.precision: Decimal = Decimal(f"1E-{precision}")
         self.max_steps: int = max_steps
+        self.method: SystemSolveMethod = method
+        self.jacobian_reuse: int = jacobian_reuse
+        self.detect_sparsity: bool = detect_sparsity
+        self.sparsity: list[set[int]] | None = None
+        self.colors: list[list[int]] = []
+        self.colored_rows: list[list[tuple[int, int]]] = []
+        if sparsity is not None:
+            self.set_sparsity(sparsity)
+        self.processes: int = processes
+        self.pool: ForkedPool | None = None
+        self.steps: int = 0
+        self.jacobian_updates: int = 0
 
     def __len__(self):
         return len(self.equations)
@@ -50,15 +84,204 @@ class EquationSystem:
     def __getitem__(self, item):
         return self.equations.__getitem__(item)
 
-    def solve(self, x: Row):
-        step = 0
-        delta_x: Row | None = None
-        while (delta_x is None or abs(max(delta_x)) > self.precision) and step < self.max_steps:
-            jacobian = LinearEquationSystem([
-                Row([equation.derivative(x, derive_by=i) for i in range(len(x))]
-                    + [equation.function(x)])
-                for equation in self])
-            delta_x = jacobian.solve()[0]
+    def set_sparsity(self, sparsity: list[Iterable[int]]) -> None:
+        if len(sparsity) != len(self):
+            raise ValueError(f"Sparsity pattern has {len(sparsity)} rows for {len(self)} equations")
+        self.sparsity = [set(row) for row in sparsity]
+        self.colors = self._color_columns()
+        self.colored_rows = [[(i, j) for i, row in enumerate(self.sparsity) for j in color if j in row]
+                             for color in self.colors]
+
+    def _color_columns(self) -> list[list[int]]:
+        # columns sharing no equation can be perturbed at once: greedy coloring, the busiest columns first
+        equations_by_column: dict[int, set[int]] = {}
+        for i, row in enumerate(self.sparsity):
+            for j in row:
+                equations_by_column.setdefault(j, set()).add(i)
+
+        colors: list[list[int]] = []
+        color_equations: list[set[int]] = []
+        for j in sorted(equations_by_column, key=lambda c: (-len(equations_by_column[c]), c)):
+            for color, used in zip(colors, color_equations):
+                if used.isdisjoint(equations_by_column[j]):
+                    color.append(j)
+                    used.update(equations_by_column[j])
+                    break
+            else:
+                colors.append([j])
+                color_equations.append(set(equations_by_column[j]))
+        return colors
+
+    def _moved(self, x: Row, columns: Iterable[int]) -> Row:
+        x_moved: Row = x.copy()
+        for i in columns:
+            x_moved[i] += self.precision
+        return x_moved
+
+    def _call(self, job: tuple[str, tuple]):
+        name, args = job
+        return getattr(self, name)(*args)
+
+    def _map(self, name: str, args: list[tuple]) -> list:
+        # evaluations are spread over the pool while solving, the rest is computed the same way serially
+        jobs: list[tuple[str, tuple]] = [(name, arg) for arg in args]
+        if self.pool is None:
+            return [self._call(job) for job in jobs]
+        return self.pool.map(jobs)
+
+    def _detect_sparsity(self, x: Row) -> list[set[int]]:
+        # probing at a shifted point makes accidental zeros (like x₁x₂ at x₂ = 0) unlikely
+        x = Row([x[j] + Decimal(j + 1) / (x.size + 1) for j in range(x.size)])
+        f_x: Row = self._residuals(x)
+        sparsity: list[set[int]] = [set() for _ in range(len(self))]
+        for j in range(x.size):
+            f_moved: Row = self._residuals(self._moved(x, [j]))
+            for i in range(len(self)):
+                if f_moved[i] != f_x[i]:
+                    sparsity[i].add(j)
+        return sparsity
+
+    def _residual(self, x: Row, i: int) -> Decimal:
+        return self[i].function(x)
+
+    def _residuals(self, x: Row) -> Row:
+        return Row(self._map("_residual", [(x, i) for i in range(len(self))]))
+
+    def _jacobian_column(self, x: Row, f_x: Row, j: int) -> Row:
+        x_moved: Row = self._moved(x, [j])  # f(x) is already known, unlike in MultiEquation.derivative
+        return Row([equation.derivative(x, derive_by=j) if equation.has_derivative
+                    else (equation.function(x_moved) - f_x[i]) / self.precision
+                    for i, equation in enumerate(self)])
+
+    def _color_entries(self, x: Row, f_x: Row, c: int) -> list[tuple[int, int, Decimal]]:
+        # a single perturbation per color: every equation sees at most one of its columns moved
+        x_moved: Row = self._moved(x, self.colors[c])
+        return [(i, j, (self[i].function(x_moved) - f_x[i]) / self.precision)
+                for i, j in self.colored_rows[c] if not self[i].has_derivative]
+
+    def _derivative_entries(self, x: Row, i: int) -> list[tuple[int, int, Decimal]]:
+        return [(i, j, self[i].derivative(x, derive_by=j)) for j in self.sparsity[i]]
+
+    def _sparse_jacobian(self, x: Row, f_x: Row) -> list[dict[int, Decimal]]:
+        self.jacobian_updates += 1
+        rows: list[dict[int, Decimal]] = [{} for _ in range(len(self))]
+        entries = self._map("_color_entries", [(x, f_x, c) for c in range(len(self.colors))]) \
+            + self._map("_derivative_entries", [(x, i) for i, equation in enumerate(self) if equation.has_derivative])
+        for part in entries:
+            for i, j, value in part:
+                rows[i][j] = value
+        return rows
+
+    def _jacobian(self, x: Row, f_x: Row) -> Matrix:
+        if self.sparsity is not None:
+            rows: list[dict[int, Decimal]] = self._sparse_jacobian(x, f_x)
+            return Matrix([Row.from_lambda(x.size, lambda j: row.get(j, Decimal())) for row in rows])
+        self.jacobian_updates += 1
+        columns: list[Row] = self._map("_jacobian_column", [(x, f_x, j) for j in range(x.size)])
+        return Matrix([Row([column[i] for column in columns]) for i in range(len(self))])
+
+    def _newton_step(self, x: Row, f_x: Row) -> Row:
+        if self.sparsity is not None:
+            return SparseLinearEquationSystem(self._sparse_jacobian(x, f_x), f_x).solve()
+        jacobian: Matrix = self._jacobian(x, f_x)
+        return LinearEquationSystem([Row([*row, f_x[i]]) for i, row in enumerate(jacobian)]).solve()[0]
+
+    def _is_converged(self, delta_x: Row) -> bool:
+        return max(abs(delta_x)) <= self.precision
+
+    def _newton(self, x: Row) -> Row:
+        f_x: Row = self._residuals(x)
+        while self.steps < self.max_steps:
+            delta_x: Row = self._newton_step(x, f_x)
             x -= delta_x
-            step += 1
+            self.steps += 1
+            if self._is_converged(delta_x):
+                break
+            f_x = self._residuals(x)
+        return x
+
+    @staticmethod
+    def _broyden_update(inverse: Matrix, step: Row, f_step: Row) -> Matrix | None:
+        # Sherman–Morrison form of the rank-one update, so the inverse never has to be recomputed
+        inverse_f_step: Row = inverse * f_step
+        step_inverse: Row = inverse.transpose_copy() * step
+        divider: Decimal = sum(step[i] * inverse_f_step[i] for i in range(step.size))
+        if divider == 0:
+            return None
+        correction: Row = (step - inverse_f_step) / divider
+        return Matrix.from_lambda(inverse.size, lambda i, j: inverse[i][j] + correction[i] * step_inverse[j])
+
+    def _quasi_newton(self, x: Row) -> Row:
+        inverse: Matrix | None = None
+        age: int = 0
+        f_x: Row = self._residuals(x)
+        while self.steps < self.max_steps:
+            if inverse is None or (self.method == SystemSolveMethod.CHORD and age >= self.jacobian_reuse):
+                inverse = self._jacobian(x, f_x).reverse_matrix()
+                age = 0
+            delta_x: Row = inverse * f_x
+            x -= delta_x
+            self.steps += 1
+            age += 1
+            if self._is_converged(delta_x):
+                break
+
+            f_x_next: Row = self._residuals(x)
+            if max(abs(f_x_next)) > self.contraction * max(abs(f_x)):
+                inverse = None  # convergence slowed down, the approximation went stale
+            elif self.method == SystemSolveMethod.BROYDEN:
+                inverse = self._broyden_update(inverse, -delta_x, f_x_next - f_x)
+            f_x = f_x_next
         return x
+
+    def solve(self, x: Row) -> Row:
+        self.steps = 0
+        self.jacobian_updates = 0
+        if self.detect_sparsity and self.sparsity is None:
+            self.set_sparsity(self._detect_sparsity(x))
+        with ForkedPool(self._call, self.processes) as self.pool:
+            try:
+                if self.method == SystemSolveMethod.NEWTON:
+                    return self._newton(x)
+                return self._quasi_newton(x)
+            finally:
+                self.pool = None
+
+
+class VectorEquationSystem(EquationSystem):
+    def __init__(self, function: VectorFunctionProtocol, size: int, jacobian: JacobianProtocol = None, *,
+                 precision: int = 10, max_steps: int = 10000, method: SystemSolveMethod = SystemSolveMethod.NEWTON,
+                 jacobian_reuse: int = 5, sparsity: list[Iterable[int]] = None, detect_sparsity: bool = False,
+                 processes: int = 1):
+        self.function: VectorFunctionProtocol = function
+        self.jacobian: JacobianProtocol | None = jacobian
+        self.size: int = size
+        super().__init__(precision=precision, max_steps=max_steps, method=method, jacobian_reuse=jacobian_reuse,
+                         sparsity=sparsity, detect_sparsity=detect_sparsity, processes=processes)
+
+    def __len__(self):
+        return self.size
+
+    def _residuals(self, x: Row) -> Row:
+        return self.function(x)
+
+    def _jacobian_column(self, x: Row, f_x: Row, j: int) -> Row:
+        # column-wise: one evaluation of the whole vector per variable
+        return (self.function(self._moved(x, [j])) - f_x) / self.precision
+
+    def _color_entries(self, x: Row, f_x: Row, c: int) -> list[tuple[int, int, Decimal]]:
+        f_moved: Row = self.function(self._moved(x, self.colors[c]))
+        return [(i, j, (f_moved[i] - f_x[i]) / self.precision) for i, j in self.colored_rows[c]]
+
+    def _sparse_jacobian(self, x: Row, f_x: Row) -> list[dict[int, Decimal]]:
+        if self.jacobian is None:
+            return super()._sparse_jacobian(x, f_x)
+        self.jacobian_updates += 1
+        jacobian: Matrix = self.jacobian(x)
+        return [{j: jacobian[i][j] for j in row} for i, row in enumerate(self.sparsity)]
+
+    def _jacobian(self, x: Row, f_x: Row) -> Matrix:
+        if self.jacobian is None or self.sparsity is not None:
+            return super()._jacobian(x, f_x)
+        self.jacobian_updates += 1
+        return self.jacobian(x)
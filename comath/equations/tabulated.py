@@ -0,0 +1,98 @@
+from bisect import bisect_right
+from decimal import Decimal
+from enum import Enum
+
+from base import Row, MappedColumns
+from .interfaces import AnyEquation
+
+
+class TabulatedInterpolation(Enum):
+    LINEAR = "Piecewise linear"
+    CUBIC = "Piecewise cubic (local Hermite with three-point slopes)"
+
+
+class TabulatedEquation(AnyEquation):
+    # the table stays on disk: only the sparse index (every index_step-th x) is kept in memory
+    def __init__(self, table: MappedColumns, x_column: int = 0, y_column: int = 1,
+                 interpolation: TabulatedInterpolation = TabulatedInterpolation.LINEAR, index_step: int = 4096):
+        if len(table) < 2:
+            raise ValueError("There must be at least two rows in the table")
+        # values are read by index through the table's own view, so lookups don't create a view per call
+        self.table: MappedColumns = table
+        self.x_column: int = x_column
+        self.y_column: int = y_column
+        self.interpolation: TabulatedInterpolation = interpolation
+        self.index_step: int = index_step
+        self.index: list[float] = [self._x(i) for i in range(0, len(table), index_step)]
+        if any(self.index[i] >= self.index[i + 1] for i in range(len(self.index) - 1)):
+            raise ValueError("Table must be sorted by x")
+        self.a: Decimal = Decimal.from_float(self._x(0))
+        self.b: Decimal = Decimal.from_float(self._x(len(table) - 1))
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def _x(self, i: int) -> float:
+        return self.table.values[i * self.table.columns + self.x_column]
+
+    def _y(self, i: int) -> float:
+        return self.table.values[i * self.table.columns + self.y_column]
+
+    def _segment(self, x: Decimal, low: int = 0) -> int:
+        # the index narrows the search to one block, so a lookup touches only a few pages of the file
+        if not self.a <= x <= self.b:
+            raise ValueError(f"{x} is outside of the table [{self.a}, {self.b}]")
+        block: int = bisect_right(self.index, x) - 1
+        low = max(low, block * self.index_step)
+        high: int = min((block + 1) * self.index_step, len(self) - 1)
+        return min(max(bisect_right(range(len(self)), x, low, high, key=self._x) - 1, 0), len(self) - 2)
+
+    def _point(self, i: int) -> tuple[Decimal, Decimal]:
+        return Decimal.from_float(self._x(i)), Decimal.from_float(self._y(i))
+
+    def _slope(self, i: int) -> Decimal:
+        # the derivative of the parabola through the neighbours, the secant at the ends
+        if i == 0 or i == len(self) - 1:
+            j: int = 0 if i == 0 else i - 1
+            (x_0, y_0), (x_1, y_1) = self._point(j), self._point(j + 1)
+            return (y_1 - y_0) / (x_1 - x_0)
+        (x_0, y_0), (x_1, y_1), (x_2, y_2) = self._point(i - 1), self._point(i), self._point(i + 1)
+        h_0, h_1 = x_1 - x_0, x_2 - x_1
+        return (h_1 * (y_1 - y_0) / h_0 + h_0 * (y_2 - y_1) / h_1) / (h_0 + h_1)
+
+    def _evaluate(self, i: int, x: Decimal, derive: bool = False) -> Decimal:
+        (x_0, y_0), (x_1, y_1) = self._point(i), self._point(i + 1)
+        h: Decimal = x_1 - x_0
+        secant: Decimal = (y_1 - y_0) / h
+        if self.interpolation == TabulatedInterpolation.LINEAR:
+            return secant if derive else y_0 + secant * (x - x_0)
+        m_0, m_1 = self._slope(i), self._slope(i + 1)
+        t: Decimal = (x - x_0) / h
+        c_2, c_3 = 3 * secant - 2 * m_0 - m_1, m_0 + m_1 - 2 * secant
+        if derive:
+            return m_0 + t * (2 * c_2 + 3 * t * c_3)
+        return y_0 + t * h * (m_0 + t * (c_2 + t * c_3))
+
+    def function(self, x: Decimal) -> Decimal:
+        return self._evaluate(self._segment(x), x)
+
+    def derivative(self, x: Decimal) -> Decimal:
+        return self._evaluate(self._segment(x), x, derive=True)
+
+    def _evaluate_row(self, xs: Row, derive: bool) -> Row:
+        # queries are handled in increasing order: the file is read forward, and every search starts
+        # from the previous segment
+        results: list[Decimal] = [Decimal()] * xs.size
+        segment: int = 0
+        for k in sorted(range(xs.size), key=lambda k: xs[k]):
+            segment = self._segment(xs[k], segment)
+            results[k] = self._evaluate(segment, xs[k], derive)
+        return Row(results)
+
+    def function_row(self, xs: Row) -> Row:
+        return self._evaluate_row(xs, False)
+
+    def derivative_row(self, xs: Row) -> Row:
+        return self._evaluate_row(xs, True)
+
+    fixed_point = None
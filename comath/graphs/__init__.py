@@ -1,5 +1,6 @@
-from .approximation import Approximator, ApproximationFunction
-from .interpolation import Interpolator, LagrangeInterpolator, NewtonInterpolator, distort_row
+from .approximation import Approximator, ApproximationFunction, NormalEquations, MomentSums
+from .interpolation import Interpolator, LagrangeInterpolator, NewtonInterpolator, BarycentricInterpolator, distort_row
+from .interpolation import HermiteInterpolatorABS, SplineBoundary, CubicSplineInterpolator, PchipInterpolator
 from .ode_solvers import EulerODES, EulerPlusODES, RungeKuttaODES, MilneODES, AdamsODES
 from .ode_solvers import ODESolver, SingleStepODES, MultiStepODES
 from .plotter import Plot, Colour, Marker, LineStyle
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from decimal import Decimal
+from decimal import Decimal, DecimalException
 from enum import Enum
+from itertools import islice
 from math import sin
+from typing import Iterable, Iterator
 
-from base import Row, LinearEquationSystem, NotImplementedField
+from base import Row, LinearEquationSystem, ForkedPool, NUMBER, NotImplementedField, number_to_decimal
 
 
 class ApproximationFunction(Enum):
@@ -31,8 +33,174 @@ class ApproximationFunction(Enum):
                 return TrigonometricApproximator()
 
 
+def _chunks(samples: Iterable[tuple[NUMBER, NUMBER]], chunk_size: int) -> Iterator[list[tuple[NUMBER, NUMBER]]]:
+    samples = iter(samples)
+    while len(chunk := list(islice(samples, chunk_size))) != 0:
+        yield chunk
+
+
+class NormalEquations:
+    # the sums Σdₖ·d_q and Σdₖ·y of a least squares fit: O(k²) memory for any number of samples,
+    # partial sums of separate chunks are merged by addition
+    def __init__(self, size: int):
+        self.size: int = size
+        self.count: int = 0
+        self.products: list[list[Decimal]] = [[Decimal()] * size for _ in range(size)]  # the upper triangle
+        self.free: list[Decimal] = [Decimal()] * size
+        self.squares: Decimal = Decimal()  # Σy², only for the error
+
+    def add(self, derivatives: Row, yi: Decimal):
+        for k in range(self.size):
+            dk: Decimal = derivatives[k]
+            row: list[Decimal] = self.products[k]
+            for q in range(k, self.size):
+                row[q] += dk * derivatives[q]
+            self.free[k] += dk * yi
+        self.squares += yi * yi
+        self.count += 1
+
+    def merge(self, other: NormalEquations) -> NormalEquations:
+        if other.size != self.size:
+            raise ValueError(f"Sizes mismatch: {self.size} != {other.size}")
+        for k in range(self.size):
+            for q in range(k, self.size):
+                self.products[k][q] += other.products[k][q]
+            self.free[k] += other.free[k]
+        self.squares += other.squares
+        self.count += other.count
+        return self
+
+    def system(self) -> LinearEquationSystem:
+        return LinearEquationSystem.from_lambda(
+            (self.size, self.size + 1),
+            lambda k, q: self.free[k] if q == self.size else self.products[min(k, q)][max(k, q)])
+
+    def solve(self) -> Row:
+        if self.count < self.size:
+            raise ValueError(f"At least {self.size} samples are needed, got {self.count}")
+        return self.system().solve()[0]
+
+    def error(self, coefficients: Row) -> Decimal:
+        # Σ(y - ∑cₖdₖ)² = Σy² - 2∑cₖ·Σdₖy + ∑∑cₖc_q·Σdₖd_q, without another pass over the samples
+        result: Decimal = self.squares
+        for k in range(self.size):
+            result -= 2 * coefficients[k] * self.free[k]
+            result += coefficients[k] * coefficients[k] * self.products[k][k]
+            for q in range(k + 1, self.size):
+                result += 2 * coefficients[k] * coefficients[q] * self.products[k][q]
+        return max(result, Decimal())
+
+    def deviation(self, coefficients: Row) -> Decimal:
+        return (self.error(coefficients) / self.count).sqrt()
+
+
+class MomentSums:
+    # the sums shared by all the ApproximationFunction models: a single pass over the samples fits every model
+    powers_of: dict[str, int] = {"1": 0, "x": 1, "x²": 2}
+
+    def __init__(self):
+        self.count: int = 0
+        self.powers: list[Decimal] = [Decimal()] * 5  # Σxᵖ for p up to 4
+        self.y_powers: list[Decimal] = [Decimal()] * 3  # Σxᵖ·y for p up to 2
+        self.squares: Decimal = Decimal()  # Σy²
+        self.logarithms: list[Decimal] = [Decimal()] * 3  # Σln x, Σln² x, Σy·ln x
+        self.sines: list[Decimal] = [Decimal()] * 3  # Σsin x, Σsin² x, Σy·sin x
+        self.logarithmic: bool = True  # false once some x ≤ 0, the logarithms are dropped then
+
+    def add(self, xi: Decimal, yi: Decimal):
+        power: Decimal = Decimal(1)
+        for p in range(5):
+            self.powers[p] += power
+            if p < 3:
+                self.y_powers[p] += power * yi
+            power *= xi
+        self.squares += yi * yi
+        if self.logarithmic and xi > 0:
+            logarithm: Decimal = xi.ln()
+            for k, value in enumerate((logarithm, logarithm * logarithm, logarithm * yi)):
+                self.logarithms[k] += value
+        else:
+            self.logarithmic = False
+        sine: Decimal = Decimal.from_float(sin(xi))
+        for k, value in enumerate((sine, sine * sine, sine * yi)):
+            self.sines[k] += value
+        self.count += 1
+
+    def accumulate(self, samples: Iterable[tuple[NUMBER, NUMBER]]) -> MomentSums:
+        for xi, yi in samples:
+            self.add(number_to_decimal(xi), number_to_decimal(yi))
+        return self
+
+    def merge(self, other: MomentSums) -> MomentSums:
+        for own, others in ((self.powers, other.powers), (self.y_powers, other.y_powers),
+                            (self.logarithms, other.logarithms), (self.sines, other.sines)):
+            for k in range(len(own)):
+                own[k] += others[k]
+        self.squares += other.squares
+        self.logarithmic = self.logarithmic and other.logarithmic
+        self.count += other.count
+        return self
+
+    @classmethod
+    def from_stream(cls, samples: Iterable[tuple[NUMBER, NUMBER]], processes: int = 1,
+                    chunk_size: int = 65536) -> MomentSums:
+        # the chunks are summed by the workers and merged in order, like in Approximator.fit_stream
+        moments: MomentSums = cls()
+        with ForkedPool(lambda chunk: cls().accumulate(chunk), processes) as pool:
+            for part in pool.imap(_chunks(samples, chunk_size)):
+                moments.merge(part)
+        return moments
+
+    def _special(self, name: str) -> list[Decimal]:
+        if name == "ln":
+            if not self.logarithmic:
+                raise ValueError("Logarithm is undefined for some of the samples")
+            return self.logarithms
+        return self.sines
+
+    def _product(self, a: str, b: str) -> Decimal:
+        if a in self.powers_of and b in self.powers_of:
+            return self.powers[self.powers_of[a] + self.powers_of[b]]
+        if a == b:
+            return self._special(a)[1]
+        if "1" in (a, b):
+            return self._special(b if a == "1" else a)[0]
+        raise ValueError(f"Σ{a}·{b} is not collected")
+
+    def _cross(self, a: str) -> Decimal:
+        if a in self.powers_of:
+            return self.y_powers[self.powers_of[a]]
+        return self._special(a)[2]
+
+    def normal_equations(self, approximator: Approximator) -> NormalEquations:
+        equations: NormalEquations = NormalEquations(approximator.size)
+        basis: tuple[str, ...] = approximator.basis
+        for k in range(approximator.size):
+            for q in range(k, approximator.size):
+                equations.products[k][q] = self._product(basis[k], basis[q])
+            equations.free[k] = self._cross(basis[k])
+        equations.squares = self.squares
+        equations.count = self.count
+        return equations
+
+    def fit_all(self) -> list[tuple[ApproximationFunction, Approximator, Decimal]]:
+        # fitted models with their standard deviations, the best one first;
+        # the models that can't be fitted to these samples are left out
+        results: list[tuple[ApproximationFunction, Approximator, Decimal]] = []
+        for function in ApproximationFunction:
+            approximator: Approximator = function.approximator()
+            try:
+                equations: NormalEquations = self.normal_equations(approximator)
+                approximator.coefficients = equations.solve()
+            except (ValueError, ZeroDivisionError, DecimalException):
+                continue
+            results.append((function, approximator, equations.deviation(approximator.coefficients)))
+        return sorted(results, key=lambda result: result[2])
+
+
 class Approximator:
     size: int = NotImplementedField
+    basis: tuple[str, ...] = NotImplementedField  # the names of the derivatives, for MomentSums
 
     def __init__(self):
         self.coefficients: Row | None = None
@@ -43,23 +211,34 @@ class Approximator:
     def derivatives(self, xi: Decimal) -> Row:
         raise NotImplementedError()
 
-    def _fit(self, xs: Row, ys: Row):
-        es = LinearEquationSystem.from_lambda((self.size, self.size + 1), lambda *_: Decimal())
-        for i in range(xs.size):
-            xi, yi = xs[i], ys[i]
-            derivatives = self.derivatives(xi)
-            for k in range(self.size):
-                for q in range(self.size):
-                    es[k][q] += derivatives[k] * derivatives[q]
-                es[k][-1] += derivatives[k] * yi
+    def accumulate(self, samples: Iterable[tuple[NUMBER, NUMBER]],
+                   equations: NormalEquations = None) -> NormalEquations:
+        # samples are taken as prepared
+        if equations is None:
+            equations = NormalEquations(self.size)
+        for xi, yi in samples:
+            equations.add(self.derivatives(number_to_decimal(xi)), number_to_decimal(yi))
+        return equations
 
-        self.coefficients = es.solve()[0]
+    def _fit(self, xs: Row, ys: Row):
+        self.coefficients = self.accumulate(zip(xs, ys)).solve()
 
     def fit(self, xs: Row, ys: Row):
         if xs.size != ys.size:
             raise ValueError(f"Xs and Ys side mismatch: {xs.size} != {ys.size}")
         xs = self.prepare(xs)
-        return self.fit(xs, ys)
+        return self._fit(xs, ys)
+
+    def fit_stream(self, samples: Iterable[tuple[NUMBER, NUMBER]], processes: int = 1,
+                   chunk_size: int = 65536) -> NormalEquations:
+        # one pass over an iterator (e.g. MappedColumns.pairs) without keeping it in memory, the chunks are
+        # accumulated by the workers and merged in order; samples are taken as prepared
+        equations = NormalEquations(self.size)
+        with ForkedPool(self.accumulate, processes) as pool:
+            for part in pool.imap(_chunks(samples, chunk_size)):
+                equations.merge(part)
+        self.coefficients = equations.solve()
+        return equations
 
     def predict_one(self, xi: Decimal) -> Decimal:
         raise NotImplementedError()
@@ -96,6 +275,7 @@ class Approximator:
 
 class ConstantApproximator(Approximator):
     size = 1
+    basis = ("1",)
 
     def derivatives(self, xi: Decimal) -> Row:
         return Row([Decimal(1)])
@@ -106,6 +286,7 @@ class ConstantApproximator(Approximator):
 
 class LinearApproximator(Approximator):
     size = 2
+    basis = ("x", "1")
 
     def derivatives(self, xi: Decimal) -> Row:
         return Row([xi, Decimal(1)])
@@ -116,6 +297,7 @@ class LinearApproximator(Approximator):
 
 class LimitedSquareApproximator(Approximator):
     size = 1
+    basis = ("x²",)
 
     def derivatives(self, xi: Decimal) -> Row:
         return Row([xi ** 2])
@@ -126,6 +308,7 @@ class LimitedSquareApproximator(Approximator):
 
 class SquareApproximator(Approximator):
     size = 3
+    basis = ("x²", "x", "1")
 
     def derivatives(self, xi: Decimal) -> Row:
         return Row([xi ** 2, xi, Decimal(1)])
@@ -136,6 +319,7 @@ class SquareApproximator(Approximator):
 
 class LogarithmicApproximator(Approximator):
     size = 2
+    basis = ("ln", "1")
 
     def prepare(self, xs: Row) -> Row:
         minimal: Decimal = min(xs)
@@ -150,6 +334,7 @@ class LogarithmicApproximator(Approximator):
 
 class TrigonometricApproximator(Approximator):
     size = 2
+    basis = ("sin", "1")
 
     def derivatives(self, xi: Decimal) -> Row:
         return Row([Decimal.from_float(sin(xi)), Decimal(1)])
@@ -1,4 +1,6 @@
+from bisect import bisect_right
 from decimal import Decimal
+from enum import Enum
 from random import random
 
 from base import Row
@@ -38,33 +40,215 @@ class LagrangeInterpolator(Interpolator):
         return result
 
 
-class NewtonInterpolator(Interpolator):
-    def _coefficients(self, xs: Row, ys: Row) -> list[Decimal]:
-        dynamic: list[list[Decimal]] = [[y for y in ys]]
-        result: list[Decimal] = [dynamic[-1][0]]
+class BarycentricInterpolator(Interpolator):
+    # the second (true) barycentric form: p(x) = ∑(wⱼyⱼ / (x - xⱼ)) / ∑(wⱼ / (x - xⱼ)), wⱼ = 1 / ∏(xⱼ - xₖ)
+    def __init__(self, xs: Row, ys: Row):
+        if xs.size != ys.size:
+            raise ValueError("Rows must have the same size")
+        self.xs: list[Decimal] = []
+        self.ys: list[Decimal] = []
+        self.weights: list[Decimal] = []
+        for x, y in zip(xs, ys):
+            self.add_node(x, y)
+
+    @property
+    def size(self) -> int:
+        return len(self.xs)
+
+    def add_node(self, x: Decimal, y: Decimal) -> None:
+        weight: Decimal = Decimal(1)
+        for j in range(self.size):
+            difference: Decimal = self.xs[j] - x
+            if difference == 0:
+                raise ValueError(f"Node {x} is already present")
+            self.weights[j] /= difference
+            weight *= -difference
+        self.xs.append(x)
+        self.ys.append(y)
+        self.weights.append(1 / weight)
 
-        for k in range(1, xs.size):
-            dynamic.append([])
-            for i in range(xs.size - k):
-                dynamic[-1].append((dynamic[-2][i + 1] - dynamic[-2][i])
-                                   / (xs[i + k] - xs[i]))
-            result.append(dynamic[-1][0])
+    def interpolate_one(self, xi: Decimal) -> Decimal:
+        numerator: Decimal = Decimal()
+        denominator: Decimal = Decimal()
+        for x, y, weight in zip(self.xs, self.ys, self.weights):
+            if xi == x:
+                return y
+            term: Decimal = weight / (xi - x)
+            numerator += term * y
+            denominator += term
+        return numerator / denominator
 
-        return result
 
+class NewtonInterpolator(Interpolator):
     def __init__(self, xs: Row, ys: Row):
-        self.size: int = xs.size
-        self.xs: Row = xs
-        self.coefficients = self._coefficients(xs, ys)
+        if xs.size != ys.size:
+            raise ValueError("Rows must have the same size")
+        self.xs: list[Decimal] = []
+        self.coefficients: list[Decimal] = []
+        # only the last diagonal of the divided differences: f[xₙ], f[xₙ₋₁, xₙ], ..., f[x₀, ..., xₙ]
+        self.diagonal: list[Decimal] = []
+        for x, y in zip(xs, ys):
+            self.add_node(x, y)
+
+    @property
+    def size(self) -> int:
+        return len(self.xs)
+
+    def add_node(self, x: Decimal, y: Decimal) -> None:
+        diagonal: list[Decimal] = [y]
+        for k, previous in enumerate(self.diagonal):
+            difference: Decimal = x - self.xs[-1 - k]
+            if difference == 0:
+                raise ValueError(f"Node {x} is already present")
+            diagonal.append((diagonal[-1] - previous) / difference)
+        self.diagonal = diagonal
+        self.xs.append(x)
+        self.coefficients.append(diagonal[-1])
 
     def interpolate_one(self, xi: Decimal) -> Decimal:
         result: Decimal = Decimal()
-        multiplier = Decimal(1)
-        for i in range(self.size):
-            result += multiplier * self.coefficients[i]
-            multiplier *= xi - self.xs[i]
+        for i in range(self.size - 1, -1, -1):
+            result = result * (xi - self.xs[i]) + self.coefficients[i]
         return result
 
+    def interpolate_row(self, xs: Row) -> Row:
+        # Horner's scheme over the whole batch at once: each coefficient and node is read only once
+        results: list[Decimal] = [Decimal()] * xs.size
+        for i in range(self.size - 1, -1, -1):
+            x_i, coefficient = self.xs[i], self.coefficients[i]
+            results = [result * (xi - x_i) + coefficient for result, xi in zip(results, xs)]
+        return Row(results)
+
+
+class HermiteInterpolatorABS(Interpolator):
+    # a cubic on every segment, given by the values and the slopes at its ends
+    def __init__(self, xs: Row, ys: Row):
+        if xs.size != ys.size:
+            raise ValueError("Rows must have the same size")
+        if xs.size < 2:
+            raise ValueError("There must be at least two nodes")
+        self.xs: list[Decimal] = list(xs)
+        self.ys: list[Decimal] = list(ys)
+        if any(self.xs[i] >= self.xs[i + 1] for i in range(len(self.xs) - 1)):
+            raise ValueError("Nodes must be sorted without repeats")
+        self.steps: list[Decimal] = [self.xs[i + 1] - self.xs[i] for i in range(len(self.xs) - 1)]
+        self.secants: list[Decimal] = [(self.ys[i + 1] - self.ys[i]) / h for i, h in enumerate(self.steps)]
+        self.slopes: list[Decimal] = self._slopes()
+
+    def _slopes(self) -> list[Decimal]:
+        raise NotImplementedError()
+
+    def _segment(self, xi: Decimal) -> int:
+        return min(max(bisect_right(self.xs, xi) - 1, 0), len(self.steps) - 1)
+
+    def _evaluate(self, i: int, xi: Decimal) -> Decimal:
+        h: Decimal = self.steps[i]
+        t: Decimal = (xi - self.xs[i]) / h
+        # y = yᵢ + t·(h·mᵢ + t·(3δ - 2mᵢ - mᵢ₊₁)·h + t²·(mᵢ + mᵢ₊₁ - 2δ)·h) with δ the secant slope
+        m_0, m_1, secant = self.slopes[i], self.slopes[i + 1], self.secants[i]
+        return self.ys[i] + t * h * (m_0 + t * ((3 * secant - 2 * m_0 - m_1) + t * (m_0 + m_1 - 2 * secant)))
+
+    def interpolate_one(self, xi: Decimal) -> Decimal:
+        return self._evaluate(self._segment(xi), xi)
+
+    def interpolate_row(self, xs: Row) -> Row:
+        if any(xs[i] > xs[i + 1] for i in range(xs.size - 1)):
+            return xs.map(self.interpolate_one)
+        # sorted queries only move forward along the segments: no search after the first one
+        results: list[Decimal] = []
+        i: int = self._segment(xs[0]) if xs.size > 0 else 0
+        for xi in xs:
+            while i < len(self.steps) - 1 and xi >= self.xs[i + 1]:
+                i += 1
+            results.append(self._evaluate(i, xi))
+        return Row(results)
+
+
+class SplineBoundary(Enum):
+    NATURAL = "Natural (zero second derivatives at the ends)"
+    CLAMPED = "Clamped (given first derivatives at the ends)"
+    NOT_A_KNOT = "Not-a-knot (continuous third derivatives at the second and the penultimate nodes)"
+
+
+class CubicSplineInterpolator(HermiteInterpolatorABS):
+    def __init__(self, xs: Row, ys: Row, boundary: SplineBoundary = SplineBoundary.NATURAL,
+                 left_slope: Decimal = None, right_slope: Decimal = None):
+        if boundary == SplineBoundary.CLAMPED and (left_slope is None or right_slope is None):
+            raise ValueError("Clamped spline needs both end slopes")
+        self.boundary: SplineBoundary = boundary
+        self.left_slope: Decimal | None = left_slope
+        self.right_slope: Decimal | None = right_slope
+        super().__init__(xs, ys)
+
+    @staticmethod
+    def _solve_tridiagonal(lower: list[Decimal], diagonal: list[Decimal], upper: list[Decimal],
+                           free: list[Decimal]) -> list[Decimal]:
+        # Thomas algorithm, lower[i] and upper[i] are the neighbours of diagonal[i] in its row
+        diagonal, free = diagonal.copy(), free.copy()
+        for i in range(1, len(diagonal)):
+            factor: Decimal = lower[i] / diagonal[i - 1]
+            diagonal[i] -= factor * upper[i - 1]
+            free[i] -= factor * free[i - 1]
+        result: list[Decimal] = [free[-1] / diagonal[-1]]
+        for i in range(len(diagonal) - 2, -1, -1):
+            result.append((free[i] - upper[i] * result[-1]) / diagonal[i])
+        return result[::-1]
+
+    def _slopes(self) -> list[Decimal]:
+        # continuity of the second derivative at every inner node:
+        # hᵢmᵢ₋₁ + 2(hᵢ₋₁ + hᵢ)mᵢ + hᵢ₋₁mᵢ₊₁ = 3(hᵢδᵢ₋₁ + hᵢ₋₁δᵢ)
+        h, secants = self.steps, self.secants
+        n: int = len(self.xs)
+        if self.boundary == SplineBoundary.NOT_A_KNOT and n < 4:
+            if n == 2:
+                return [secants[0], secants[0]]
+            middle: Decimal = (h[1] * secants[0] + h[0] * secants[1]) / (h[0] + h[1])  # the only parabola
+            return [2 * secants[0] - middle, middle, 2 * secants[1] - middle]
+        lower: list[Decimal] = [Decimal()] + [h[i] for i in range(1, n - 1)] + [Decimal()]
+        diagonal: list[Decimal] = [Decimal(1)] + [2 * (h[i - 1] + h[i]) for i in range(1, n - 1)] + [Decimal(1)]
+        upper: list[Decimal] = [Decimal()] + [h[i - 1] for i in range(1, n - 1)] + [Decimal()]
+        free: list[Decimal] = [Decimal()] + [3 * (h[i] * secants[i - 1] + h[i - 1] * secants[i])
+                                             for i in range(1, n - 1)] + [Decimal()]
+        match self.boundary:
+            case SplineBoundary.NATURAL:
+                diagonal[0], upper[0], free[0] = Decimal(2), Decimal(1), 3 * secants[0]
+                lower[-1], diagonal[-1], free[-1] = Decimal(1), Decimal(2), 3 * secants[-1]
+            case SplineBoundary.CLAMPED:
+                free[0], free[-1] = self.left_slope, self.right_slope
+            case SplineBoundary.NOT_A_KNOT:
+                width: Decimal = h[0] + h[1]
+                diagonal[0], upper[0] = h[1], width
+                free[0] = ((h[0] + 2 * width) * h[1] * secants[0] + h[0] ** 2 * secants[1]) / width
+                width = h[-1] + h[-2]
+                lower[-1], diagonal[-1] = width, h[-2]
+                free[-1] = (h[-1] ** 2 * secants[-2] + (2 * width + h[-1]) * h[-2] * secants[-1]) / width
+        return self._solve_tridiagonal(lower, diagonal, upper, free)
+
+
+class PchipInterpolator(HermiteInterpolatorABS):
+    # monotone piecewise cubic (Fritsch–Butland slopes): no overshoots between the nodes
+    def _end_slope(self, h_0: Decimal, h_1: Decimal, secant_0: Decimal, secant_1: Decimal) -> Decimal:
+        slope: Decimal = ((2 * h_0 + h_1) * secant_0 - h_0 * secant_1) / (h_0 + h_1)
+        if slope * secant_0 <= 0:
+            return Decimal()
+        if secant_0 * secant_1 < 0 and abs(slope) > 3 * abs(secant_0):
+            return 3 * secant_0
+        return slope
+
+    def _slopes(self) -> list[Decimal]:
+        h, secants = self.steps, self.secants
+        if len(self.xs) == 2:
+            return [secants[0], secants[0]]
+        slopes: list[Decimal] = [self._end_slope(h[0], h[1], secants[0], secants[1])]
+        for i in range(1, len(self.xs) - 1):
+            if secants[i - 1] * secants[i] <= 0:
+                slopes.append(Decimal())
+                continue
+            left_weight, right_weight = 2 * h[i] + h[i - 1], h[i] + 2 * h[i - 1]
+            slopes.append((left_weight + right_weight) / (left_weight / secants[i - 1] + right_weight / secants[i]))
+        slopes.append(self._end_slope(h[-1], h[-2], secants[-1], secants[-2]))
+        return slopes
+
 
 def distort_row(ys: Row, strength: float = 1) -> Row:
     return Row([y if random() > 0.5 else y * Decimal.from_float(1 + 0.02 * strength * (random() - 0.5)) for y in ys])
@@ -3,7 +3,8 @@ from enum import Enum
 from typing import Callable
 
 from base import beautify_decimal, Row, input_decimal, input_menu, checked_input, input_int_range, input_bool
-from equations import BisectionSolver, SecantSolver, NewtonSolver, IterationSolver, functions, AnyEquation, Solver
+from equations import BisectionSolver, SecantSolver, BrentSolver, NewtonSolver, IterationSolver, functions, AnyEquation
+from equations import Solver, SteffensenSolver
 from equations import StraightParamSpec, IterativeParamSpec, LambdaEquation, EquationSystem
 
 
@@ -35,8 +36,10 @@ if __name__ == "__main__":
     solver_types = [
         BisectionSolver,
         SecantSolver,
+        BrentSolver,
         NewtonSolver,
         IterationSolver,
+        SteffensenSolver,
     ]
 
     while not input_bool("Do you want to skip solving equations? "):
@@ -65,11 +68,11 @@ if __name__ == "__main__":
                     lambda x: x.exp() + 3,
                 )
 
-        print("\nEntering params for BisectionSolver and SecantSolver")
+        print("\nEntering params for BisectionSolver, SecantSolver and BrentSolver")
         left: Decimal = input_decimal("Enter the left border: ")
         right: Decimal = input_decimal("Enter the right border: ", lambda x: x if x > left else None)
 
-        print("\nEntering the params for NewtonSolver and IterationSolver")
+        print("\nEntering the params for NewtonSolver, IterationSolver and SteffensenSolver")
         initial_guess: Decimal = input_decimal("Enter the initial guess: ")
 
         params_straight: StraightParamSpec = StraightParamSpec(left, right)
@@ -78,7 +81,7 @@ if __name__ == "__main__":
         results: dict[str, Decimal | None] = {}
         for i, (name, solver) in enumerate(solvers.items()):
             try:
-                results[name] = solver.solve(function, params_straight if i < 2 else params_iterative)
+                results[name] = solver.solve(function, params_straight if i < 3 else params_iterative)
             except ValueError as e:
                 print(f"ERROR for {name}:", e.args[0])
                 results[name] = None
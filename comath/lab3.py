@@ -5,6 +5,8 @@ from typing import Callable
 from base import beautify_decimal, input_menu, input_decimal, checked_input, input_bool
 from equations import IntegratorParamSpec, LeftRectangleIntegrator, RightRectangleIntegrator, AnyEquation, Integrator
 from equations import MiddleRectangleIntegrator, TrapezoidalIntegrator, SimpsonsIntegrator
+from equations import AdaptiveSimpsonsIntegrator, GaussKronrodIntegrator, RombergIntegrator, GaussLegendreIntegrator
+from equations import TanhSinhIntegrator
 from equations import functions
 
 HIDE_SEPARATIONS: bool = False
@@ -106,6 +108,10 @@ if __name__ == "__main__":
         MiddleRectangleIntegrator,
         TrapezoidalIntegrator,
         SimpsonsIntegrator,
+        AdaptiveSimpsonsIntegrator,
+        GaussKronrodIntegrator,
+        GaussLegendreIntegrator,
+        TanhSinhIntegrator,
     ]
 
     while True:
@@ -166,23 +172,15 @@ if __name__ == "__main__":
         results: dict[str, tuple[Decimal, int | None]]
         if by_precision:
             print("\nCalculating the results...")
-            integrator = TrapezoidalIntegrator(10)
-            prev: Decimal = integrator.solve(function, IntegratorParamSpec(left, right))
-            curr: Decimal
-            while True:
-                integrator.separations *= 2
-                curr = integrator.solve(function, IntegratorParamSpec(left, right))
-                if abs(curr - prev) <= precision:
-                    break
-                prev = curr
-            results = {TrapezoidalIntegrator.__name__: (curr, integrator.separations)}
+            integrator = RombergIntegrator(precision)
+            results = {RombergIntegrator.__name__: integrator.solve_counted(function, IntegratorParamSpec(left, right))}
         else:
             integrators: dict[str, Integrator] = {integrator_type.__name__: integrator_type()
                                                   for integrator_type in integrator_types}
             print("\nCalculating the results...")
             if has_breaks:
-                print("Algorithmic mean will be used to deal with breaks")
-            results = {name: (integrator.solve(function, IntegratorParamSpec(left, right)), integrator.separations)
+                print("The range will be split at the breaks, the panels next to them are integrated by an open rule")
+            results = {name: integrator.solve_counted(function, IntegratorParamSpec(left, right))
                        for name, integrator in integrators.items()}
 
         results["NewtonLeibnizRule"] = (antiderivative(right) - antiderivative(left), None)
@@ -0,0 +1,82 @@
+from decimal import Decimal
+
+import pytest
+
+from base import Row
+from graphs import ApproximationFunction, NormalEquations, MomentSums
+from graphs.approximation import LinearApproximator, SquareApproximator
+
+XS = [Decimal(k) / 10 + 1 for k in range(200)]
+LINE = [(x, 3 * x - 2) for x in XS]
+NOISY = [(x, x * x - 2 * x + 1 + Decimal((k * 7919) % 13 - 6) / 100) for k, x in enumerate(XS)]
+
+
+def close(a: Row, b: Row, precision: Decimal = Decimal("1E-35")) -> bool:
+    return a.size == b.size and all(abs(x - y) < precision for x, y in zip(a, b))
+
+
+def test_stream_fit_recovers_a_line():
+    approximator = LinearApproximator()
+    equations = approximator.fit_stream(iter(LINE), chunk_size=17)
+    assert close(approximator.coefficients, Row([3, -2]))
+    assert equations.count == len(LINE)
+    assert equations.error(approximator.coefficients) < Decimal("1E-30")
+
+
+def test_merged_chunks_match_a_single_pass():
+    approximator = SquareApproximator()
+    single = approximator.accumulate(NOISY)
+    merged = approximator.accumulate(NOISY[:77]).merge(approximator.accumulate(NOISY[77:]))
+    assert close(single.solve(), merged.solve())
+    assert merged.count == single.count
+
+
+def test_stream_fit_doesnt_depend_on_workers():
+    results = [SquareApproximator().fit_stream(iter(NOISY), processes=processes, chunk_size=30)
+               for processes in (1, 3)]
+    assert results[0].products == results[1].products and results[0].free == results[1].free
+
+
+def test_error_matches_the_residuals():
+    # Σy² - 2c·b + c·A·c cancels a few digits against the direct sum
+    approximator = SquareApproximator()
+    equations = approximator.fit_stream(NOISY)
+    xs, ys = Row([x for x, _ in NOISY]), Row([y for _, y in NOISY])
+    assert abs(equations.error(approximator.coefficients) - sum(approximator.calculate_errors(xs, ys))) \
+        < Decimal("1E-30")
+
+
+def test_normal_equations_are_checked():
+    with pytest.raises(ValueError):
+        NormalEquations(2).merge(NormalEquations(3))
+    with pytest.raises(ValueError):
+        LinearApproximator().fit_stream(LINE[:1])
+
+
+def test_fit_all_matches_separate_fits():
+    moments = MomentSums().accumulate(NOISY)
+    ranking = moments.fit_all()
+    assert {function for function, _, _ in ranking} == set(ApproximationFunction)
+    assert ranking[0][0] == ApproximationFunction.FULL_SQUARE
+    xs, ys = Row([x for x, _ in NOISY]), Row([y for _, y in NOISY])
+    for function, approximator, deviation in ranking:
+        separate = function.approximator()
+        separate.fit(xs, ys)
+        assert close(approximator.coefficients, separate.coefficients, Decimal("1E-30"))
+        assert abs(deviation - (sum(separate.calculate_errors(xs, ys)) / len(NOISY)).sqrt()) < Decimal("1E-15")
+    assert [deviation for _, _, deviation in ranking] == sorted(deviation for _, _, deviation in ranking)
+
+
+def test_logarithmic_model_is_dropped_for_non_positive_xs():
+    moments = MomentSums().accumulate([(x - 2, y) for x, y in NOISY])
+    assert ApproximationFunction.LOGARITHMIC not in {function for function, _, _ in moments.fit_all()}
+
+
+def test_moments_merge_and_stream():
+    merged = MomentSums()
+    for start in range(0, len(NOISY), 50):
+        merged.merge(MomentSums().accumulate(NOISY[start:start + 50]))
+    streamed = [MomentSums.from_stream(iter(NOISY), processes=processes, chunk_size=50) for processes in (1, 3)]
+    assert streamed[0].powers == streamed[1].powers == merged.powers
+    assert streamed[0].sines == merged.sines and streamed[0].logarithms == merged.logarithms
+    assert merged.count == len(NOISY)
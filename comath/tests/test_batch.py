@@ -0,0 +1,46 @@
+from decimal import Decimal
+
+import pytest
+
+from equations import BatchSolver, BrentSolver, NewtonSolver, StraightParamSpec, IterativeParamSpec
+from equations import ProbedEquation, SquareEquation
+
+# x² - c for c = 1..40, the roots are √c
+JOBS = [(Decimal(1), Decimal(0), Decimal(-c)) for c in range(1, 41)]
+
+
+def close(results, expected, precision=Decimal("1E-17")):
+    return all(abs(result - root) < precision for result, root in zip(results, expected))
+
+
+@pytest.mark.parametrize("params", [StraightParamSpec(0, 10), StraightParamSpec(10, 0)])
+def test_straight_batch_accepts_both_orders(params):
+    batch = BatchSolver(BrentSolver(root_precision=19), processes=1, chunk_size=16)
+    results = list(batch.solve(JOBS, params, SquareEquation))
+    assert close(results, [Decimal(c).sqrt() for c in range(1, 41)])
+
+
+def test_warm_start_evaluates_every_point_once():
+    probes = [ProbedEquation(SquareEquation(*job), trace_size=1000) for job in JOBS]
+    batch = BatchSolver(BrentSolver(root_precision=19), processes=1, chunk_size=40)
+    list(batch.solve(probes, StraightParamSpec(0, 10)))
+    for probe in probes[1:]:
+        xs = [x for x, _ in probe.trace]
+        assert len(xs) == len(set(xs))
+
+
+def test_warm_start_falls_back_to_the_full_bracket():
+    # the root jumps from 1 to 9: the narrow bracket around 1 has no sign change
+    jobs = [(Decimal(1), Decimal(0), Decimal(-1)), (Decimal(1), Decimal(0), Decimal("-1.0001")),
+            (Decimal(1), Decimal(0), Decimal(-81))]
+    results = list(BatchSolver(BrentSolver(root_precision=19), processes=1).solve(jobs, StraightParamSpec(0, 10),
+                                                                                   SquareEquation))
+    assert close(results, [Decimal(1), Decimal("1.0001").sqrt(), Decimal(9)])
+
+
+def test_parallel_batch_matches_serial():
+    solver = NewtonSolver(root_precision=19)
+    serial = list(BatchSolver(solver, processes=1, chunk_size=7).solve(JOBS, IterativeParamSpec(1), SquareEquation))
+    parallel = list(BatchSolver(solver, processes=2, chunk_size=7).solve(JOBS, IterativeParamSpec(1), SquareEquation))
+    assert serial == parallel
+    assert close(serial, [Decimal(c).sqrt() for c in range(1, 41)])
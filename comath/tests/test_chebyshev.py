@@ -0,0 +1,50 @@
+from decimal import Decimal, getcontext
+
+import pytest
+
+from base import decimal_cos, decimal_pi
+from equations import ChebyshevEquation, LambdaEquation, ProbedEquation
+
+EXPONENT = LambdaEquation(lambda x: x.exp(), lambda x: x.exp())
+
+
+def test_decimal_cos_keeps_the_precision():
+    assert decimal_cos(decimal_pi()) == -1
+    assert abs(decimal_cos(decimal_pi() / 3) - Decimal("0.5")) < Decimal("1E-41")
+    assert abs(decimal_cos(Decimal(1000)) - Decimal("0.5623790762907029910782492266053959687558")) < Decimal("1E-39")
+    assert getcontext().prec == 42
+
+
+def test_fit_approximates_the_function():
+    surrogate = ChebyshevEquation.fit(EXPONENT, -1, 2, tolerance="1E-30")
+    for x in (Decimal(-1), Decimal("0.37"), Decimal("1.99"), Decimal(2)):
+        assert abs(surrogate.function(x) - x.exp()) < Decimal("1E-29")
+    assert abs(surrogate.derivative(Decimal("0.5")) - Decimal("0.5").exp()) < Decimal("1E-27")
+
+
+def test_fit_reuses_the_nested_samples():
+    # the degree doubles from 16, every level only evaluates the new odd nodes: 2ᵏ + 1 values in total
+    probe = ProbedEquation(EXPONENT)
+    surrogate = ChebyshevEquation.fit(probe, 0, 1, tolerance="1E-35")
+    assert probe.function_evaluations in (17, 33, 65)
+    assert len(surrogate.coefficients) < probe.function_evaluations
+
+
+@pytest.mark.parametrize("a, b", [(0, 2), (2, 0), (Decimal("0.5"), Decimal("1.5"))])
+def test_integrals(a, b):
+    surrogate = ChebyshevEquation.fit(EXPONENT, 0, 2, tolerance="1E-30")
+    expected = Decimal(b).exp() - Decimal(a).exp()
+    assert abs(surrogate.integrate(a, b) - expected) < Decimal("1E-28")
+
+
+def test_polynomials_are_fitted_exactly():
+    surrogate = ChebyshevEquation.fit(LambdaEquation(lambda x: x ** 3 - 2 * x, None), -2, 2)
+    assert len(surrogate.coefficients) == 4
+    assert abs(surrogate.differentiate().function(Decimal(1)) - 1) < Decimal("1E-38")
+
+
+def test_fit_fails_for_unreachable_tolerances():
+    with pytest.raises(ValueError):
+        ChebyshevEquation.fit(LambdaEquation(lambda x: abs(x), None), -1, 1, tolerance="1E-30", max_degree=64)
+    with pytest.raises(ValueError):
+        ChebyshevEquation([1], 1, 1)
@@ -0,0 +1,79 @@
+from decimal import Decimal
+
+import pytest
+
+from base import Row
+from equations import CubatureParamSpec, TensorGaussIntegrator, QuasiMonteCarloIntegrator, LowDiscrepancySequence
+
+
+def polynomial(x: Row) -> Decimal:
+    return x[0] ** 3 * x[1] + x[1] ** 2 * x[2] + 1
+
+
+def smooth(x: Row) -> Decimal:
+    return (x[0] + x[1]).exp()  # (e - 1)² over the unit square
+
+
+BOX = CubatureParamSpec([(0, 1), (0, 2), (0, 1)])
+BOX_EXACT = Decimal(1) / 4 * 2 + Decimal(8) / 3 / 2 + 2  # ∫x³y = 1/4 · 2, ∫y²z = 8/3 · 1/2, ∫1 = 2
+SQUARE_EXACT = (Decimal(1).exp() - 1) ** 2
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_tensor_gauss_is_exact_for_polynomials(processes):
+    integrator = TensorGaussIntegrator(order=3, processes=processes, batch_size=5)
+    result, points = integrator.solve_counted(polynomial, BOX)
+    assert abs(result - BOX_EXACT) < Decimal("1E-38")
+    assert points == integrator.evaluations == 27
+
+
+def test_tensor_gauss_results_dont_depend_on_workers():
+    square = CubatureParamSpec([(0, 1)] * 2)
+    results = {TensorGaussIntegrator(order=12, processes=processes, batch_size=10).solve(smooth, square)
+               for processes in (1, 2, 3)}
+    assert len(results) == 1
+    assert abs(results.pop() - SQUARE_EXACT) < Decimal("1E-25")
+
+
+def test_reversed_limits_change_the_sign():
+    integrator = TensorGaussIntegrator(order=3)
+    reversed_box = CubatureParamSpec([(1, 0), (0, 2), (0, 1)])
+    assert integrator.solve(polynomial, reversed_box) == -integrator.solve(polynomial, BOX)
+
+
+@pytest.mark.parametrize("sequence", list(LowDiscrepancySequence))
+def test_quasi_monte_carlo_estimates_its_error(sequence):
+    integrator = QuasiMonteCarloIntegrator(points=1024, shifts=8, sequence=sequence, seed=1)
+    result, evaluations = integrator.solve_counted(smooth, CubatureParamSpec([(0, 1)] * 2))
+    assert evaluations == integrator.evaluations == 1024 * 8
+    assert abs(result - SQUARE_EXACT) < max(5 * integrator.error, Decimal("1E-6"))
+    assert integrator.error < Decimal("1E-2")
+
+
+@pytest.mark.parametrize("sequence", list(LowDiscrepancySequence))
+def test_quasi_monte_carlo_is_deterministic(sequence):
+    results = [QuasiMonteCarloIntegrator(points=512, sequence=sequence, seed=7, processes=processes,
+                                         batch_size=100).solve(smooth, CubatureParamSpec([(0, 1)] * 2))
+               for processes in (1, 2)]
+    assert results[0] == results[1]
+
+
+def test_sobol_points_are_stratified():
+    # every 2ᵏ consecutive points from the start put one point in every dyadic interval of the first dimension
+    points = QuasiMonteCarloIntegrator()._sobol(3, 0, 16, (0, 0, 0))
+    assert sorted(int(point[0] * 16) for point in points) == list(range(16))
+    assert sorted(int(point[1] * 16) for point in points) == list(range(16))
+
+
+def test_sobol_start_matches_the_full_sequence():
+    integrator = QuasiMonteCarloIntegrator()
+    assert integrator._sobol(2, 0, 40, (0.3, 0.6))[13:] == integrator._sobol(2, 13, 40, (0.3, 0.6))
+
+
+def test_cubature_limits_are_checked():
+    with pytest.raises(ValueError):
+        QuasiMonteCarloIntegrator().solve(smooth, CubatureParamSpec([(0, 1)] * 9))
+    with pytest.raises(ValueError):
+        QuasiMonteCarloIntegrator(shifts=1)
+    with pytest.raises(ValueError):
+        TensorGaussIntegrator().solve(smooth, CubatureParamSpec([]))
@@ -0,0 +1,197 @@
+from decimal import Decimal
+
+import pytest
+
+from equations import AdaptiveSimpsonsIntegrator, GaussKronrodIntegrator, RombergIntegrator, GaussLegendreIntegrator
+from equations import TanhSinhIntegrator, LeftRectangleIntegrator, MiddleRectangleIntegrator, RightRectangleIntegrator
+from equations import TrapezoidalIntegrator, SimpsonsIntegrator, IntegratorParamSpec
+from equations import LambdaEquation, PolynomialEquation, TrigonometricEquation, TrigonometricEquationType
+from equations import functions
+
+CUBIC = PolynomialEquation(1, -2, 0, 3)  # x³ - 2x² + 3, 81/4 - 18 + 9 = 45/4 over [0, 3]
+EXPONENT = LambdaEquation(lambda x: x.exp(), lambda x: x.exp())
+SIN = TrigonometricEquation(TrigonometricEquationType.SIN)
+COS_1 = Decimal("0.5403023058681397174009366074429766037323")
+
+
+@pytest.mark.parametrize("integrator_type", [AdaptiveSimpsonsIntegrator, GaussKronrodIntegrator])
+@pytest.mark.parametrize("params", [IntegratorParamSpec(0, 3), IntegratorParamSpec(3, 0)])
+def test_adaptive_integrators_on_a_polynomial(integrator_type, params):
+    result = integrator_type(root_precision=30).solve(CUBIC, params)
+    expected = Decimal("11.25") * (1 if params.convert()[0] < params.convert()[1] else -1)
+    assert abs(result - expected) < Decimal("1E-30")
+
+
+@pytest.mark.parametrize("integrator_type", [AdaptiveSimpsonsIntegrator, GaussKronrodIntegrator])
+def test_adaptive_integrators_estimate_their_error(integrator_type):
+    integrator = integrator_type(tolerance=Decimal("1E-16"))
+    result = integrator.solve(EXPONENT, IntegratorParamSpec(0, 1))
+    assert abs(result - (Decimal(1).exp() - 1)) < Decimal("1E-15")
+    assert integrator.error < Decimal("1E-16")
+    assert integrator.evaluations < 10000
+
+
+@pytest.mark.parametrize("integrator_type", [AdaptiveSimpsonsIntegrator, GaussKronrodIntegrator])
+def test_default_tolerance_is_reachable_for_float_functions(integrator_type):
+    # sine is computed in floats: the old 1E-20 default ran to the interval limit
+    integrator = integrator_type()
+    result, intervals = integrator.solve_counted(SIN, IntegratorParamSpec(0, 1))
+    assert abs(result - (1 - COS_1)) < Decimal("1E-12")
+    assert intervals < integrator.separations
+    assert integrator.evaluations < 500
+
+
+def test_simpson_reuses_the_values_of_split_intervals():
+    # 5 values for the first interval, 2 new ones for every half after it
+    integrator = AdaptiveSimpsonsIntegrator(tolerance=Decimal("1E-15"))
+    _, intervals = integrator.solve_counted(EXPONENT, IntegratorParamSpec(0, 1))
+    assert integrator.evaluations == 5 + 2 * (2 * (intervals - 1))
+
+
+def test_kronrod_takes_fifteen_evaluations_per_interval():
+    integrator = GaussKronrodIntegrator(tolerance=Decimal("1E-30"))
+    _, intervals = integrator.solve_counted(EXPONENT, IntegratorParamSpec(0, 1))
+    assert integrator.evaluations == 15 * (2 * intervals - 1)
+
+
+@pytest.mark.parametrize("equation, expected", [(CUBIC, Decimal("11.25")), (EXPONENT, Decimal(3).exp() - 1)])
+def test_romberg_on_smooth_functions(equation, expected):
+    integrator = RombergIntegrator(tolerance=Decimal("1E-30"))
+    result, separations = integrator.solve_counted(equation, IntegratorParamSpec(0, 3))
+    assert abs(result - expected) < Decimal("1E-30")
+    # every level only evaluates its new midpoints: the finest grid is all the work
+    assert integrator.evaluations == separations + 1
+
+
+def test_romberg_stops_when_the_extrapolants_stall():
+    # float values can't agree to 1E-20: the old loop ran to 65537 evaluations
+    integrator = RombergIntegrator(root_precision=20)
+    result = integrator.solve(SIN, IntegratorParamSpec(0, 1))
+    assert abs(result - (1 - COS_1)) < Decimal("1E-15")
+    assert integrator.evaluations <= 1025
+
+
+@pytest.mark.parametrize("order", [2, 5, 20])
+def test_gauss_legendre_is_exact_for_polynomials_up_to_its_degree(order):
+    coefficients = [Decimal(k + 1) for k in range(2 * order)]
+    exact = sum(c / (2 * order - k) * 2 ** (2 * order - k) for k, c in enumerate(coefficients))
+    result = GaussLegendreIntegrator(order=order).solve(PolynomialEquation(*coefficients), IntegratorParamSpec(0, 2))
+    assert abs(result / exact - 1) < Decimal("1E-38")
+
+
+def test_gauss_legendre_on_a_smooth_function():
+    integrator = GaussLegendreIntegrator(order=30)
+    result, panels = integrator.solve_counted(EXPONENT, IntegratorParamSpec(0, 3))
+    assert abs(result - (Decimal(3).exp() - 1)) < Decimal("1E-38")
+    assert panels == 1
+
+
+def test_gauss_legendre_nodes_are_cached_on_disk(tmp_path):
+    integrator = GaussLegendreIntegrator(order=17, cache_directory=str(tmp_path))
+    nodes = integrator.nodes()
+    GaussLegendreIntegrator.nodes_cache.clear()
+    assert len(list(tmp_path.iterdir())) == 1
+    assert GaussLegendreIntegrator(order=17, cache_directory=str(tmp_path)).nodes() == nodes
+    assert abs(sum(nodes[1]) - 2) < Decimal("1E-38")
+
+
+def test_gauss_legendre_rejects_empty_rules():
+    with pytest.raises(ValueError):
+        GaussLegendreIntegrator(order=0)
+
+
+@pytest.mark.parametrize("equation, expected", [
+    (LambdaEquation(lambda x: 1 / x.sqrt(), None), Decimal(2)),
+    (LambdaEquation(lambda x: x.ln(), None), Decimal(-1)),
+])
+def test_tanh_sinh_handles_endpoint_singularities(equation, expected):
+    integrator = TanhSinhIntegrator(tolerance=Decimal("1E-30"))
+    assert abs(integrator.solve(equation, IntegratorParamSpec(0, 1)) - expected) < Decimal("1E-30")
+    assert integrator.evaluations < 1000
+
+
+def test_tanh_sinh_stops_when_the_levels_stall():
+    integrator = TanhSinhIntegrator(root_precision=20)
+    result = integrator.solve(SIN, IntegratorParamSpec(0, 1))
+    assert abs(result - (1 - COS_1)) < Decimal("1E-15")
+    assert integrator.evaluations < 600
+
+
+@pytest.mark.parametrize("integrator_type, separations, evaluations", [
+    (TrapezoidalIntegrator, 1000, 1001),
+    (SimpsonsIntegrator, 100, 201),
+    (MiddleRectangleIntegrator, 1000, 1000),
+])
+def test_chunked_integrators_evaluate_every_node_once(integrator_type, separations, evaluations):
+    _, report = integrator_type(separations).solve_with_report(EXPONENT, IntegratorParamSpec(0, 3))
+    assert report.function_evaluations == evaluations
+
+
+@pytest.mark.parametrize("integrator_type", [LeftRectangleIntegrator, MiddleRectangleIntegrator,
+                                             RightRectangleIntegrator, TrapezoidalIntegrator, SimpsonsIntegrator])
+def test_chunked_results_dont_depend_on_workers(integrator_type):
+    results = {integrator_type(4000, processes=processes).solve(EXPONENT, IntegratorParamSpec(0, 3))
+               for processes in (1, 2, 3)}
+    assert len(results) == 1
+    assert abs(results.pop() - (Decimal(3).exp() - 1)) < Decimal("1E-2")
+
+
+@pytest.mark.parametrize("integrator_type, precision", [
+    (MiddleRectangleIntegrator, Decimal("1E-7")),
+    (TrapezoidalIntegrator, Decimal("2E-7")),
+    (SimpsonsIntegrator, Decimal("1E-16")),
+])
+def test_chunked_integrators_converge(integrator_type, precision):
+    result = integrator_type(10000, chunks=7).solve(EXPONENT, IntegratorParamSpec(0, 3))
+    assert abs(result - (Decimal(3).exp() - 1)) < precision
+
+
+INVERSE_SQRT = LambdaEquation(lambda x: 1 / x.sqrt(), None)
+
+
+@pytest.mark.parametrize("integrator, precision", [
+    (LeftRectangleIntegrator(10000), Decimal("1E-2")), (RightRectangleIntegrator(10000), Decimal("1E-2")),
+    (TrapezoidalIntegrator(), Decimal("1E-3")), (SimpsonsIntegrator(), Decimal("1E-4")),
+    (RombergIntegrator(), Decimal("1E-4")), (AdaptiveSimpsonsIntegrator(), Decimal("1E-12")),
+    (TanhSinhIntegrator(), Decimal("1E-12")),
+])
+@pytest.mark.parametrize("params", [IntegratorParamSpec(0, 1, [0]), IntegratorParamSpec(1, 0, [0])])
+def test_panels_next_to_a_break_use_an_open_rule(integrator, precision, params):
+    # closed rules used to evaluate 1/√x just next to the break, far from its one-sided limit
+    expected = 2 if params.convert()[0] < params.convert()[1] else -2
+    assert abs(integrator.solve(INVERSE_SQRT, params) - expected) < precision
+
+
+def test_closed_rules_keep_their_own_accuracy_around_breaks():
+    # eˣ·sign(x): only the panels next to 0 are left to the open rule, the rest shows the rule's error
+    equation = LambdaEquation(lambda x: x.exp() if x > 0 else -x.exp(), None)
+    params = IntegratorParamSpec(-1, 2, [0])
+    expected = Decimal(2).exp() - 1 - (1 - Decimal(-1).exp())
+    results = {}
+    for integrator in (TrapezoidalIntegrator(300), SimpsonsIntegrator(30), RombergIntegrator()):
+        results[type(integrator)], steps = integrator.solve_counted(equation, params)
+        assert abs(results[type(integrator)] - expected) < Decimal("1E-4")
+        assert steps == integrator.separations or isinstance(integrator, RombergIntegrator)
+    assert len(set(results.values())) == 3
+    assert abs(results[TrapezoidalIntegrator] - expected) > abs(results[SimpsonsIntegrator] - expected)
+
+
+@pytest.mark.parametrize("integrator", [
+    TrapezoidalIntegrator(1000), SimpsonsIntegrator(), MiddleRectangleIntegrator(1000),
+    GaussKronrodIntegrator(), GaussLegendreIntegrator(), TanhSinhIntegrator(),
+])
+@pytest.mark.parametrize("params, expected", [(IntegratorParamSpec(-1, 2), 1), (IntegratorParamSpec(2, -1), -1)])
+def test_equation_breaks_split_the_interval(integrator, params, expected):
+    # |x| / x advertises its break at 0, both limits orders split there
+    assert abs(integrator.solve(functions.SignEquation(False), params) - expected) < Decimal("1E-12")
+
+
+def test_break_rule_counts_are_merged():
+    integrator = AdaptiveSimpsonsIntegrator()
+    integrator.solve(INVERSE_SQRT, IntegratorParamSpec(0, 1, [0]))
+    assert integrator.evaluations > 0
+    assert integrator.error < Decimal("1E-12")
+
+
+def test_empty_interval():
+    assert TrapezoidalIntegrator().solve_counted(INVERSE_SQRT, IntegratorParamSpec(1, 1)) == (0, 0)
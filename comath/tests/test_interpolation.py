@@ -0,0 +1,160 @@
+from decimal import Decimal
+
+import pytest
+
+from base import Row, decimal_cos, decimal_pi
+from graphs import BarycentricInterpolator, LagrangeInterpolator, NewtonInterpolator
+from graphs import SplineBoundary, CubicSplineInterpolator, PchipInterpolator
+
+XS = Row([Decimal(x) for x in ("-2", "-0.5", "0", "1", "1.5", "3")])
+
+
+def cubic(x: Decimal) -> Decimal:
+    return 2 * x ** 3 - x ** 2 + 3 * x - 7
+
+
+def runge(x: Decimal) -> Decimal:
+    return 1 / (1 + 25 * x * x)
+
+
+def chebyshev_points(n: int) -> Row:
+    # the second kind: cos(kπ / (n - 1))
+    return Row([decimal_cos(k * decimal_pi() / (n - 1)) for k in range(n)])
+
+
+def test_barycentric_reproduces_polynomials():
+    interpolator = BarycentricInterpolator(XS, XS.map(cubic))
+    for x in (Decimal("-1.7"), Decimal("0.3"), Decimal("2.9"), Decimal(10)):
+        assert abs(interpolator.interpolate_one(x) - cubic(x)) < Decimal("1E-36") * (1 + abs(cubic(x)))
+
+
+def test_barycentric_returns_node_values_exactly():
+    ys = XS.map(runge)
+    interpolator = BarycentricInterpolator(XS, ys)
+    assert list(interpolator.interpolate_row(XS)) == list(ys)
+
+
+def test_barycentric_nodes_can_be_added_one_by_one():
+    whole = BarycentricInterpolator(XS, XS.map(runge))
+    incremental = BarycentricInterpolator(Row([XS[0]]), Row([runge(XS[0])]))
+    for x in list(XS)[1:]:
+        incremental.add_node(x, runge(x))
+    assert incremental.weights == whole.weights
+    with pytest.raises(ValueError):
+        incremental.add_node(XS[2], Decimal())
+
+
+def test_barycentric_is_stable_on_chebyshev_points():
+    # the monomial-based LagrangeInterpolator loses all digits on the same nodes
+    xs = chebyshev_points(200)
+    interpolator = BarycentricInterpolator(xs, xs.map(runge))
+    checks = [Decimal(k) / 97 - 1 for k in range(1, 194, 7)]
+    assert max(abs(interpolator.interpolate_one(x) - runge(x)) for x in checks) < Decimal("1E-15")
+
+
+def test_barycentric_matches_lagrange_on_few_nodes():
+    ys = XS.map(runge)
+    barycentric, lagrange = BarycentricInterpolator(XS, ys), LagrangeInterpolator(XS, ys)
+    assert abs(barycentric.interpolate_one(Decimal("0.7")) - lagrange.interpolate_one(Decimal("0.7"))) \
+        < Decimal("1E-35")
+
+
+def divided_differences(xs: Row, ys: Row) -> list[Decimal]:
+    # the full triangular table, the top edge gives the coefficients
+    column: list[Decimal] = list(ys)
+    result: list[Decimal] = [column[0]]
+    for k in range(1, xs.size):
+        column = [(column[i + 1] - column[i]) / (xs[i + k] - xs[i]) for i in range(len(column) - 1)]
+        result.append(column[0])
+    return result
+
+
+def test_newton_coefficients_match_the_full_table():
+    ys = XS.map(runge)
+    assert NewtonInterpolator(XS, ys).coefficients == divided_differences(XS, ys)
+
+
+def test_newton_nodes_can_be_added_one_by_one():
+    whole = NewtonInterpolator(XS, XS.map(runge))
+    incremental = NewtonInterpolator(Row([XS[0]]), Row([runge(XS[0])]))
+    for x in list(XS)[1:]:
+        incremental.add_node(x, runge(x))
+    assert incremental.coefficients == whole.coefficients
+    assert len(incremental.diagonal) == incremental.size
+    with pytest.raises(ValueError):
+        incremental.add_node(XS[-1], Decimal())
+
+
+def test_newton_row_matches_single_points():
+    interpolator = NewtonInterpolator(XS, XS.map(cubic))
+    points = Row([Decimal(k) / 7 - 2 for k in range(30)])
+    assert list(interpolator.interpolate_row(points)) == [interpolator.interpolate_one(x) for x in points]
+    assert all(abs(interpolator.interpolate_one(x) - cubic(x)) < Decimal("1E-36") * (1 + abs(cubic(x)))
+               for x in points)
+
+
+def cubic_slope(x: Decimal) -> Decimal:
+    return 6 * x ** 2 - 2 * x + 3
+
+
+POINTS = Row([Decimal(k) / 9 - 2 for k in range(46)])
+
+
+@pytest.mark.parametrize("interpolator", [
+    CubicSplineInterpolator(XS, XS.map(cubic), SplineBoundary.NOT_A_KNOT),
+    CubicSplineInterpolator(XS, XS.map(cubic), SplineBoundary.CLAMPED, cubic_slope(XS[0]), cubic_slope(XS[-1])),
+])
+def test_splines_reproduce_cubics(interpolator):
+    assert all(abs(interpolator.interpolate_one(x) - cubic(x)) < Decimal("1E-36") * (1 + abs(cubic(x)))
+               for x in POINTS)
+
+
+@pytest.mark.parametrize("boundary", list(SplineBoundary))
+@pytest.mark.parametrize("size", [2, 3, 6])
+def test_splines_reproduce_lines(boundary, size):
+    xs = Row(list(XS)[:size])
+    interpolator = CubicSplineInterpolator(xs, xs.map(lambda x: 3 * x - 1), boundary, Decimal(3), Decimal(3))
+    assert all(abs(interpolator.interpolate_one(x) - (3 * x - 1)) < Decimal("1E-38") for x in POINTS)
+
+
+def test_natural_spline_has_straight_ends():
+    # a cubic segment's second derivative at its start is (6δ - 4m₀ - 2m₁) / h, so only the numerator is checked
+    interpolator = CubicSplineInterpolator(XS, XS.map(runge))
+    m, secant = interpolator.slopes, interpolator.secants
+    assert abs(6 * secant[0] - 4 * m[0] - 2 * m[1]) < Decimal("1E-38")
+    assert abs(6 * secant[-1] - 2 * m[-2] - 4 * m[-1]) < Decimal("1E-38")
+
+
+@pytest.mark.parametrize("interpolator_type", [CubicSplineInterpolator, PchipInterpolator])
+def test_sorted_rows_match_single_points(interpolator_type):
+    interpolator = interpolator_type(XS, XS.map(runge))
+    assert list(interpolator.interpolate_row(POINTS)) == [interpolator.interpolate_one(x) for x in POINTS]
+    shuffled = Row(list(POINTS)[::-3])
+    assert list(interpolator.interpolate_row(shuffled)) == [interpolator.interpolate_one(x) for x in shuffled]
+    assert all(abs(value - runge(x)) < Decimal("1E-38") for value, x in zip(interpolator.interpolate_row(XS), XS))
+
+
+def test_pchip_keeps_step_data_in_range():
+    xs = Row([Decimal(x) for x in range(8)])
+    ys = Row([Decimal(y) for y in (0, 0, 0, 0, 5, 5, 5, 5)])
+    points = Row([Decimal(k) / 10 for k in range(71)])
+    values = list(PchipInterpolator(xs, ys).interpolate_row(points))
+    assert all(0 <= value <= 5 for value in values)
+    assert values == sorted(values)
+    assert min(CubicSplineInterpolator(xs, ys).interpolate_row(points)) < 0
+
+
+@pytest.mark.parametrize("arguments", [
+    (Row([1, 0, 2]), Row([0, 0, 0])),
+    (Row([0, 1, 1]), Row([0, 0, 0])),
+    (Row([0]), Row([0])),
+    (Row([0, 1]), Row([0])),
+])
+def test_hermite_nodes_are_checked(arguments):
+    with pytest.raises(ValueError):
+        PchipInterpolator(*arguments)
+
+
+def test_clamped_spline_needs_both_slopes():
+    with pytest.raises(ValueError):
+        CubicSplineInterpolator(XS, XS.map(runge), SplineBoundary.CLAMPED, Decimal(1))
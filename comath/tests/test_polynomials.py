@@ -0,0 +1,51 @@
+from decimal import Decimal
+
+import pytest
+
+from base import ComplexDecimal
+from equations import AberthSolver, PolynomialParamSpec, PolynomialEquation
+
+
+def sorted_roots(roots: list) -> list[complex]:
+    return sorted((complex(float(z.real), float(z.imag)) for z in roots), key=lambda z: (round(z.real, 9), z.imag))
+
+
+@pytest.mark.parametrize("decimal_mode", [True, False])
+def test_real_and_complex_roots(decimal_mode):
+    # (x - 1)(x + 2)(x² + 1)
+    roots = AberthSolver(decimal_mode=decimal_mode).solve(PolynomialEquation(1, 1, -1, 1, -2))
+    expected = [-2, -1j, 1j, 1]
+    assert all(abs(z - w) < 1e-12 for z, w in zip(sorted_roots(roots), expected))
+
+
+def test_decimal_mode_residuals():
+    equation = PolynomialEquation(1, 0, -2, -5)
+    for root in AberthSolver(root_precision=25).solve(equation):
+        p = ComplexDecimal.convert(0)
+        for coefficient in equation.coefficients:
+            p = p * root + ComplexDecimal.convert(coefficient)
+        assert abs(p) < Decimal("1E-24")
+
+
+def test_leading_zeros_are_dropped():
+    roots = AberthSolver().solve(PolynomialEquation(0, 0, 1, 0, -4))
+    assert len(roots) == 2
+    assert all(abs(z - w) < 1e-15 for z, w in zip(sorted_roots(roots), [-2, 2]))
+
+
+def test_constant_polynomial_is_rejected():
+    with pytest.raises(ValueError):
+        AberthSolver().solve(PolynomialEquation(0, 0, 3))
+
+
+def test_refine_keeps_roots():
+    solver = AberthSolver(root_precision=30)
+    equation = PolynomialEquation(1, -6, 11, -6)
+    rough = AberthSolver(decimal_mode=False).solve(equation)
+    refined = solver.solve(equation, PolynomialParamSpec(rough))
+    assert all(abs(z.real - k) < Decimal("1E-28") for z, k in zip(refined, (1, 2, 3)))
+
+
+def test_wrong_number_of_guesses():
+    with pytest.raises(ValueError):
+        AberthSolver().solve(PolynomialEquation(1, -6, 11, -6), PolynomialParamSpec([1, 2]))
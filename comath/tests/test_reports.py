@@ -0,0 +1,36 @@
+from decimal import Decimal
+
+from equations import AberthSolver, BrentSolver, NewtonSolver, SimpsonsIntegrator, StraightParamSpec
+from equations import IterativeParamSpec, IntegratorParamSpec, PolynomialEquation, SquareEquation
+
+SQUARE = SquareEquation(Decimal(1), Decimal(0), Decimal(-2))
+
+
+def test_report_iterations_match_solve_counted():
+    solver = BrentSolver(root_precision=19)
+    result, steps = solver.solve_counted(SQUARE, StraightParamSpec(0, 2))
+    reported, report = solver.solve_with_report(SQUARE, StraightParamSpec(0, 2))
+    assert reported == result
+    assert report.iterations == steps
+    assert report.residual < Decimal("1E-18")
+
+
+def test_shared_solver_keeps_no_state():
+    solver = NewtonSolver(root_precision=19)
+    counted = [solver.solve_counted(SQUARE, IterativeParamSpec(x)) for x in (1, 100, 1)]
+    assert counted[0] == counted[2]
+    assert counted[1][1] > counted[0][1]
+    assert not hasattr(solver, "steps")
+
+
+def test_aberth_report_reads_coefficients_through_the_probe():
+    roots, report = AberthSolver().solve_with_report(PolynomialEquation(1, 0, -4), None)
+    assert [round(float(z.real), 12) for z in roots] == [-2, 2]
+    assert report.iterations == AberthSolver().solve_counted(PolynomialEquation(1, 0, -4))[1]
+    assert report.residual < Decimal("1E-12")
+
+
+def test_integrator_reports_separations():
+    result, report = SimpsonsIntegrator(100).solve_with_report(SQUARE, IntegratorParamSpec(0, 3))
+    assert abs(result - 3) < Decimal("1E-30")
+    assert report.iterations == 100
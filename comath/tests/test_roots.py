@@ -0,0 +1,46 @@
+from decimal import Decimal
+
+import pytest
+
+from equations import RootIsolator, BrentSolver, BisectionSolver, StraightParamSpec, PolynomialEquation
+from equations import TrigonometricEquation, TrigonometricEquationType
+
+PRECISION = Decimal("1E-8")
+
+
+def close(found: list[Decimal], expected: list[Decimal]) -> bool:
+    return len(found) == len(expected) and all(abs(x - y) < PRECISION for x, y in zip(found, expected))
+
+
+@pytest.mark.parametrize("params", [StraightParamSpec(-3.3, 4.1), StraightParamSpec(right_limit=4.1, left_limit=-3.3)])
+def test_touching_root_in_both_orders(params):
+    isolator = RootIsolator(BrentSolver(root_precision=15))
+    assert close(isolator.solve(PolynomialEquation(1, -2, 1), params), [Decimal(1)])
+
+
+@pytest.mark.parametrize("params", [StraightParamSpec(-3, 4), StraightParamSpec(4, -3)])
+def test_all_simple_roots_in_both_orders(params):
+    # (x + 2)(x - 1)(x - 3)
+    isolator = RootIsolator(BrentSolver(root_precision=15))
+    assert close(isolator.solve(PolynomialEquation(1, -2, -5, 6), params), [Decimal(-2), Decimal(1), Decimal(3)])
+
+
+def test_close_pair_between_samples():
+    # (x - 1)(x - 1.001)(x + 2): both roots fall between two samples without a sign change
+    equation = PolynomialEquation(1, Decimal("-0.001"), Decimal("-3.001"), Decimal("2.002"))
+    isolator = RootIsolator(BrentSolver(root_precision=15), samples=100)
+    assert close(isolator.solve(equation, StraightParamSpec(-3.05, 3)), [Decimal(-2), Decimal(1), Decimal("1.001")])
+
+
+def test_poles_are_not_roots():
+    equation = TrigonometricEquation(TrigonometricEquationType.TAN)
+    isolator = RootIsolator(BisectionSolver(root_precision=15, max_steps=200))
+    roots = isolator.solve(equation, StraightParamSpec(-2, 4))
+    assert close(roots, [Decimal(0), Decimal("3.14159265358979323846")])
+
+
+def test_pool_matches_serial():
+    equation = PolynomialEquation(1, -2, -5, 6)
+    serial = RootIsolator(BrentSolver(root_precision=15)).solve(equation, StraightParamSpec(-3, 4))
+    pooled = RootIsolator(BrentSolver(root_precision=15), processes=2).solve(equation, StraightParamSpec(-3, 4))
+    assert serial == pooled
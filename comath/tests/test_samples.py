@@ -0,0 +1,69 @@
+from decimal import Decimal
+
+import pytest
+
+from base import Row, MappedColumns
+from equations import TrapezoidalSampleIntegrator, SimpsonsSampleIntegrator
+
+
+def square(x: Decimal) -> Decimal:
+    return 3 * x * x - 2 * x + 1  # x³ - x² + x is the antiderivative
+
+
+def antiderivative(x: Decimal) -> Decimal:
+    return x ** 3 - x ** 2 + x
+
+
+# a non-uniform grid with an odd and an even number of intervals
+GRIDS = [[Decimal(x) for x in ("0", "0.1", "0.25", "0.3", "0.6", "1", "1.2", "2")],
+         [Decimal(x) for x in ("0", "0.1", "0.25", "0.3", "0.6", "1", "2")]]
+
+
+@pytest.mark.parametrize("grid", GRIDS)
+def test_simpson_is_exact_for_parabolas_on_any_grid(grid):
+    samples = ((x, square(x)) for x in grid)  # a generator: the samples are streamed
+    cumulative = list(SimpsonsSampleIntegrator().cumulative(samples))
+    assert [x for x, _ in cumulative] == grid
+    assert all(abs(result - antiderivative(x)) < Decimal("1E-38") for x, result in cumulative)
+
+
+@pytest.mark.parametrize("grid", GRIDS)
+def test_trapezoid_is_exact_for_lines(grid):
+    xs = Row(grid)
+    ys = Row([2 * x + 1 for x in grid])
+    assert TrapezoidalSampleIntegrator().integrate_rows(xs, ys) == grid[-1] ** 2 + grid[-1]
+
+
+def test_two_samples_fall_back_to_a_trapezoid():
+    assert SimpsonsSampleIntegrator().integrate([(0, 1), (2, 3)]) == 4
+
+
+@pytest.mark.parametrize("samples", [[(0, 1), (0, 2)], [(1, 1), (0, 2)]])
+def test_unsorted_samples_are_rejected(samples):
+    with pytest.raises(ValueError):
+        TrapezoidalSampleIntegrator().integrate(samples)
+
+
+def test_rows_must_match():
+    with pytest.raises(ValueError):
+        SimpsonsSampleIntegrator().integrate_rows(Row([0, 1, 2]), Row([0, 1]))
+
+
+def test_mapped_samples(tmp_path):
+    filename = str(tmp_path / "samples.bin")
+    MappedColumns.write(filename, ((i / 100, (i / 100) ** 2) for i in range(101)), buffer_rows=7)
+    with MappedColumns(filename) as table:
+        result = SimpsonsSampleIntegrator().integrate(table.pairs())
+    assert abs(result - Decimal(1) / 3) < Decimal("1E-15")
+
+
+def test_mapped_table_closes_with_live_views(tmp_path):
+    # strided views used to keep the map exported, so closing raised BufferError
+    filename = str(tmp_path / "samples.bin")
+    MappedColumns.write(filename, ((i, i * i) for i in range(10)))
+    with MappedColumns(filename) as table:
+        column, pairs, rows = table.column(1), table.pairs(), iter(table)
+        assert (column[3], next(pairs), next(rows)) == (9, (0, 0), (0, 0))
+    for read in (lambda: column[0], lambda: next(pairs), lambda: next(rows)):
+        with pytest.raises(ValueError):
+            read()
@@ -0,0 +1,72 @@
+from decimal import Decimal
+
+import pytest
+
+from equations import BisectionSolver, SecantSolver, BrentSolver, StraightParamSpec, IterativeParamSpec
+from equations import NewtonSolver, IterationSolver, SteffensenSolver
+from equations import SquareEquation, PolynomialEquation, LambdaEquation
+
+SQUARE = SquareEquation(Decimal(1), Decimal(0), Decimal(-2))
+CUBIC = PolynomialEquation(1, 0, -2, -5)
+EXPONENT = LambdaEquation(lambda x: x.exp() + 3 * x, lambda x: x.exp() + 3)
+CUBIC_ROOT = Decimal("2.094551481542326591482386540579302963857")
+EXPONENT_ROOT = Decimal("-0.2576276530497367042199360453750648285811")
+
+
+@pytest.mark.parametrize("equation, a, b, root", [
+    (SQUARE, 0, 2, Decimal(2).sqrt()),
+    (CUBIC, 2, 3, CUBIC_ROOT),
+    (EXPONENT, -1, 0, EXPONENT_ROOT),
+])
+@pytest.mark.parametrize("solver_type", [BisectionSolver, SecantSolver, BrentSolver])
+def test_straight_solvers_find_root(solver_type, equation, a, b, root):
+    solver = solver_type(root_precision=19, max_steps=1000000)
+    assert abs(solver.solve(equation, StraightParamSpec(a, b)) - root) < Decimal("1E-17")
+
+
+@pytest.mark.parametrize("equation, a, b", [(SQUARE, 0, 2), (CUBIC, 2, 3), (EXPONENT, -1, 0)])
+def test_brent_accepts_descending_limits(equation, a, b):
+    solver = BrentSolver(root_precision=19)
+    ascending = solver.solve(equation, StraightParamSpec(a, b))
+    assert abs(solver.solve(equation, StraightParamSpec(b, a)) - ascending) < Decimal("1E-17")
+
+
+@pytest.mark.parametrize("equation, a, b, precision, evaluations", [
+    (SQUARE, 0, 2, 10, 8), (CUBIC, 2, 3, 10, 7), (EXPONENT, -1, 0, 10, 6),
+    (SQUARE, 0, 2, 19, 9), (CUBIC, 2, 3, 19, 8), (EXPONENT, -1, 0, 19, 7),
+])
+def test_brent_evaluations(equation, a, b, precision, evaluations):
+    _, report = BrentSolver(root_precision=precision).solve_with_report(equation, StraightParamSpec(a, b))
+    assert report.function_evaluations <= evaluations
+    _, bisection = BisectionSolver(root_precision=precision).solve_with_report(equation, StraightParamSpec(a, b))
+    assert report.function_evaluations < bisection.function_evaluations
+
+
+def test_brent_rejects_bracket_without_sign_change():
+    with pytest.raises(ValueError):
+        BrentSolver().solve(SQUARE, StraightParamSpec(2, 3))
+
+
+@pytest.mark.parametrize("equation, guess, root, iteration_evaluations, steffensen_evaluations", [
+    (SquareEquation(Decimal(1), Decimal(-3), Decimal(2)), 0, Decimal(1), 127, 16),
+    (SquareEquation(Decimal(1), Decimal(1), Decimal(-1)), Decimal("0.5"), (Decimal(5).sqrt() - 1) / 2, 91, 13),
+])
+def test_steffensen_accelerates_fixed_point_iteration(equation, guess, root, iteration_evaluations,
+                                                      steffensen_evaluations):
+    iteration, slow = IterationSolver(root_precision=19).solve_with_report(equation, IterativeParamSpec(guess))
+    steffensen, fast = SteffensenSolver(root_precision=19).solve_with_report(equation, IterativeParamSpec(guess))
+    assert abs(iteration - root) < Decimal("1E-18") and abs(steffensen - root) < Decimal("1E-18")
+    assert slow.evaluations <= iteration_evaluations
+    assert fast.evaluations <= steffensen_evaluations
+
+
+def test_diverging_iteration_raises():
+    with pytest.raises(ValueError):
+        IterationSolver(root_precision=19, max_steps=1000000).solve(CUBIC, IterativeParamSpec(2))
+    assert abs(SteffensenSolver(root_precision=19).solve(CUBIC, IterativeParamSpec(2)) - CUBIC_ROOT) < Decimal("1E-18")
+
+
+def test_newton_runs_to_max_steps_without_stagnation_exit():
+    # the precision can't be reached in 42 digits: Newton keeps iterating as it did before
+    _, report = NewtonSolver(root_precision=45, max_steps=50).solve_with_report(SQUARE, IterativeParamSpec(1))
+    assert report.iterations == 50
@@ -0,0 +1,125 @@
+from decimal import Decimal
+
+import pytest
+
+from base import Row, Matrix
+from equations import EquationSystem, VectorEquationSystem, SystemSolveMethod
+
+DOUBLE = (
+    lambda x: Decimal("0.1") * x[0] ** 2 + x[0] + Decimal("0.2") * x[1] ** 2 - Decimal("0.3"),
+    lambda x: Decimal("0.2") * x[0] ** 2 + x[1] - Decimal("0.1") * x[0] * x[1] - Decimal("0.7"),
+)
+SIZE = 8
+CHAIN_SPARSITY = [{j for j in (i - 1, i, i + 1) if 0 <= j < SIZE} for i in range(SIZE)]
+
+
+def chain(x: Row) -> Row:
+    # every component touches its neighbours only: the Jacobian is tridiagonal
+    return Row([x[i] ** 3 + x[i] - ((x[i - 1] if i > 0 else 0) + (x[i + 1] if i < SIZE - 1 else 0)) / 4 - 1
+                for i in range(SIZE)])
+
+
+def chain_equations() -> list:
+    return [lambda x, i=i: chain(x)[i] for i in range(SIZE)]
+
+
+def residual(function, x: Row) -> Decimal:
+    return max(abs(function(x)))
+
+
+def counted(function, calls: list[int] = None):
+    # several functions can share one counter
+    calls = [0] if calls is None else calls
+
+    def result(x):
+        calls[0] += 1
+        return function(x)
+
+    return result, calls
+
+
+@pytest.mark.parametrize("method", list(SystemSolveMethod))
+def test_methods_solve_the_lab_system(method):
+    system = EquationSystem(*DOUBLE, precision=20, method=method)
+    x = system.solve(Row([0, 0]))
+    assert max(abs(equation.function(x)) for equation in system) < Decimal("1E-18")
+
+
+@pytest.mark.parametrize("method", [SystemSolveMethod.CHORD, SystemSolveMethod.BROYDEN])
+def test_quasi_newton_builds_fewer_jacobians(method):
+    newton = EquationSystem(*DOUBLE, precision=20)
+    newton.solve(Row([0, 0]))
+    system = EquationSystem(*DOUBLE, precision=20, method=method, jacobian_reuse=10)
+    system.solve(Row([0, 0]))
+    assert system.jacobian_updates < newton.jacobian_updates
+
+
+def test_broyden_needs_fewer_evaluations():
+    evaluations = {}
+    for method in (SystemSolveMethod.NEWTON, SystemSolveMethod.BROYDEN):
+        calls = [0]
+        equations = [counted(function, calls)[0] for function in DOUBLE]
+        EquationSystem(*equations, precision=20, method=method).solve(Row([0, 0]))
+        evaluations[method] = calls[0]
+    assert evaluations[SystemSolveMethod.BROYDEN] < evaluations[SystemSolveMethod.NEWTON]
+
+
+def test_sparse_jacobian_uses_three_colors():
+    system = EquationSystem(*chain_equations(), precision=20, sparsity=CHAIN_SPARSITY)
+    assert len(system.colors) == 3
+    dense = EquationSystem(*chain_equations(), precision=20).solve(Row.from_lambda(SIZE))
+    sparse = system.solve(Row.from_lambda(SIZE))
+    assert residual(chain, sparse) < Decimal("1E-18")
+    assert max(abs(dense - sparse)) < Decimal("1E-18")
+
+
+@pytest.mark.parametrize("system_type", [EquationSystem, VectorEquationSystem])
+def test_sparsity_detection(system_type):
+    system = EquationSystem(*chain_equations(), detect_sparsity=True) if system_type is EquationSystem \
+        else VectorEquationSystem(chain, SIZE, detect_sparsity=True)
+    system.solve(Row.from_lambda(SIZE))
+    assert system.sparsity == CHAIN_SPARSITY
+
+
+def test_sparsity_must_cover_every_equation():
+    with pytest.raises(ValueError):
+        EquationSystem(*DOUBLE, sparsity=[{0}])
+
+
+def test_vector_system_calls_per_iteration():
+    # the first residual, then n columns and a residual per step: the last step stops before its residual
+    function, calls = counted(chain)
+    system = VectorEquationSystem(function, SIZE, precision=20)
+    x = system.solve(Row.from_lambda(SIZE))
+    assert residual(chain, x) < Decimal("1E-18")
+    assert calls[0] == system.steps * (SIZE + 1)
+
+
+def test_vector_system_with_sparsity_calls_per_color():
+    function, calls = counted(chain)
+    system = VectorEquationSystem(function, SIZE, precision=20, sparsity=CHAIN_SPARSITY)
+    system.solve(Row.from_lambda(SIZE))
+    assert calls[0] == system.steps * (len(system.colors) + 1)
+
+
+def test_vector_system_uses_the_given_jacobian():
+    def jacobian(x: Row) -> Matrix:
+        return Matrix.from_lambda((SIZE, SIZE), lambda i, j: 3 * x[i] ** 2 + 1 if i == j
+                                  else Decimal("-0.25") if abs(i - j) == 1 else Decimal())
+
+    function, calls = counted(chain)
+    system = VectorEquationSystem(function, SIZE, jacobian, precision=20)
+    x = system.solve(Row.from_lambda(SIZE))
+    assert residual(chain, x) < Decimal("1E-18")
+    assert calls[0] == system.steps
+
+
+@pytest.mark.parametrize("method", list(SystemSolveMethod))
+@pytest.mark.parametrize("sparsity", [None, CHAIN_SPARSITY])
+def test_parallel_solve_matches_serial(method, sparsity):
+    results = [EquationSystem(*chain_equations(), precision=20, method=method, sparsity=sparsity,
+                              processes=processes).solve(Row.from_lambda(SIZE)) for processes in (1, 2)]
+    assert list(results[0]) == list(results[1])
+    vector_results = [VectorEquationSystem(chain, SIZE, precision=20, method=method, sparsity=sparsity,
+                                           processes=processes).solve(Row.from_lambda(SIZE)) for processes in (1, 2)]
+    assert list(vector_results[0]) == list(vector_results[1])
@@ -0,0 +1,64 @@
+from decimal import Decimal, ROUND_FLOOR
+
+import pytest
+
+from base import Row, MappedColumns
+from equations import TabulatedEquation, TabulatedInterpolation
+
+
+@pytest.fixture()
+def table(tmp_path):
+    # x = k / 8 and y = x² are exact in float64, the extra column is skipped by x_column and y_column
+    filename = str(tmp_path / "table.bin")
+    MappedColumns.write(filename, ((k * 7, k / 8, (k / 8) ** 2) for k in range(-40, 41)))
+    with MappedColumns(filename, columns=3) as table:
+        yield table
+
+
+QUERIES = [Decimal(k) / 13 for k in range(-64, 65)]
+
+
+def test_linear_interpolation(table):
+    equation = TabulatedEquation(table, 1, 2, index_step=4)
+    for x in QUERIES:
+        k = (x * 8).to_integral_value(ROUND_FLOOR)
+        x_0, x_1 = k / 8, (k + 1) / 8
+        expected = x_0 ** 2 + (x_1 ** 2 - x_0 ** 2) * (x - x_0) * 8
+        assert abs(equation.function(x) - expected) < Decimal("1E-38")
+        assert abs(equation.derivative(x) - (x_0 + x_1)) < Decimal("1E-38")
+
+
+@pytest.mark.parametrize("index_step", [1, 5, 4096])
+def test_cubic_interpolation_reproduces_parabolas(table, index_step):
+    # three-point slopes are exact for a parabola, except for the secants at the ends
+    equation = TabulatedEquation(table, 1, 2, TabulatedInterpolation.CUBIC, index_step)
+    for x in QUERIES:
+        if -Decimal("4.875") <= x <= Decimal("4.875"):
+            assert abs(equation.function(x) - x * x) < Decimal("1E-38")
+            assert abs(equation.derivative(x) - 2 * x) < Decimal("1E-37")
+
+
+def test_rows_match_single_points(table):
+    equation = TabulatedEquation(table, 1, 2, TabulatedInterpolation.CUBIC, index_step=8)
+    xs = Row(QUERIES[::-1][::3] + QUERIES[1::5])
+    assert list(equation.function_row(xs)) == [equation.function(x) for x in xs]
+    assert list(equation.derivative_row(xs)) == [equation.derivative(x) for x in xs]
+
+
+def test_queries_outside_the_table_are_rejected(table):
+    equation = TabulatedEquation(table, 1, 2)
+    assert equation.function(Decimal(5)) == 25
+    with pytest.raises(ValueError):
+        equation.function(Decimal("5.01"))
+
+
+def test_tables_are_checked(tmp_path):
+    filename = str(tmp_path / "unsorted.bin")
+    MappedColumns.write(filename, [(0, 0), (2, 0), (1, 0)])
+    with MappedColumns(filename) as table:
+        with pytest.raises(ValueError):
+            TabulatedEquation(table, index_step=1)
+    MappedColumns.write(filename, [(0, 0)])
+    with MappedColumns(filename) as table:
+        with pytest.raises(ValueError):
+            TabulatedEquation(table)
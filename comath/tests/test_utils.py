@@ -0,0 +1,18 @@
+from decimal import Decimal, getcontext, localcontext
+
+from base import decimal_pi, compensated_sum
+
+PI = "3.14159265358979323846264338327950288419716939937510582097494459"
+
+
+def test_decimal_pi_follows_the_precision():
+    assert decimal_pi() == +Decimal(PI)
+    with localcontext() as context:
+        context.prec = 60
+        assert decimal_pi() == +Decimal(PI)
+    assert getcontext().prec == 42
+
+
+def test_compensated_sum_keeps_small_terms():
+    values = [Decimal("1E40"), Decimal(1), Decimal("-1E40")] * 100
+    assert compensated_sum(values) == 100